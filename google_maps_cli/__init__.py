@@ -1,4 +1,4 @@
 """Google Maps CLI - Command-line interface for Google Maps Platform."""
 
-__version__ = "1.0.0"
+__version__ = "1.1.0"
 
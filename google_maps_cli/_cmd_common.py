@@ -0,0 +1,141 @@
+"""Options and helpers shared by the Google Maps CLI command modules."""
+
+import functools
+import json
+import sys
+
+import click
+
+from .utils import format_coordinates, orjson, parse_coordinates
+
+
+MODE_CHOICE = click.Choice(["driving", "walking", "bicycling", "transit"])
+UNITS_CHOICE = click.Choice(["metric", "imperial"])
+AVOID_CHOICE = click.Choice(["tolls", "highways", "ferries", "indoor"])
+OUTPUT_CHOICE = click.Choice(["keys", "full"])
+
+
+def _resolve_account(ctx, param, value):
+    """Fall back to the group-level --account when the command doesn't set one."""
+    return value or (ctx.obj or {}).get("ACCOUNT")
+
+
+account_option = click.option("--account", "-a", callback=_resolve_account,
+                              help="Account name to use (default: current default account)")
+no_cache_option = click.option("--no-cache", is_flag=True, help="Bypass the local response cache")
+json_option = click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+language_option = click.option("--language", help="Language code")
+region_option = click.option("--region", help="Region code (ccTLD)")
+mode_option = click.option("--mode", type=MODE_CHOICE, default="driving", help="Travel mode")
+units_option = click.option("--units", type=UNITS_CHOICE, default="metric", help="Units")
+
+
+def handle_errors(func):
+    """
+    Report a command's unexpected errors as a one-line message and exit 1.
+    
+    Args:
+        func: Click command callback
+    
+    Returns:
+        Wrapped callback
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            click.echo(f"❌ Error: {e}", err=True)
+            sys.exit(1)
+    return wrapper
+
+
+def parse_locations(value):
+    """
+    Split a pipe-separated location argument into a list.
+    
+    "lat,lng" entries are parsed into (lat, lng) float pairs once here;
+    anything else (addresses, place IDs) is passed through unchanged.
+    
+    Args:
+        value: Pipe-separated locations, or an "enc:" encoded polyline
+    
+    Returns:
+        List of location strings and (lat, lng) tuples
+    """
+    if value.startswith("enc:"):
+        return [value]  # Encoded polylines may contain '|'
+    
+    locations = []
+    for part in value.split("|"):
+        try:
+            locations.append(parse_coordinates(part))
+        except ValueError:
+            locations.append(part)
+    return locations
+
+
+def record_location(record):
+    """Formatted geometry location of an API result, or None if it has none."""
+    location = record.get("geometry", {}).get("location", {})
+    lat = location.get("lat")
+    lng = location.get("lng")
+    return format_coordinates(lat, lng) if lat and lng else None
+
+
+def format_record(title, record, fields):
+    """
+    Render one result as a title line followed by indented "Label: value" lines.
+    
+    Args:
+        title: First line of the record
+        record: API result dict
+        fields: Sequence of (label, getter) pairs; getter(record) returns the
+            value to show, or None to omit the line
+    
+    Returns:
+        Text block ending in a blank line
+    """
+    lines = [title]
+    for label, getter in fields:
+        value = getter(record)
+        if value is not None:
+            lines.append(f"   {label}: {value}")
+    return "\n".join(lines) + "\n"
+
+
+@functools.lru_cache(maxsize=8)
+def get_api(account=None, use_oauth=False):
+    """
+    Get a MapsAPI client, reusing the one already built for the same account.
+    
+    Args:
+        account: Account name (optional). If None, uses default account.
+        use_oauth: If True, use OAuth instead of API key
+    
+    Returns:
+        MapsAPI instance
+    """
+    from .api import MapsAPI
+    return MapsAPI(account, use_oauth=use_oauth)
+
+
+def emit_json(obj):
+    """
+    Write obj to stdout as indented JSON.
+    
+    Serializes straight into the stream rather than building the whole
+    document as a string first, which matters for large matrix or route
+    responses. Non-ASCII text is written as-is instead of escaped. When
+    orjson is installed its encoder is used, writing bytes directly.
+    
+    Args:
+        obj: JSON-serializable object
+    """
+    if orjson is not None:
+        click.get_binary_stream("stdout").write(
+            orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+        return
+    json.dump(obj, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
@@ -0,0 +1,175 @@
+"""Directions and distance matrix commands for Google Maps CLI."""
+
+import click
+import html
+import re
+from .utils import format_distance, format_duration
+from ._cmd_common import (
+    AVOID_CHOICE, account_option, emit_json, get_api, handle_errors, json_option,
+    language_option, mode_option, no_cache_option, parse_locations, units_option,
+)
+
+# Matches any HTML tag in step instructions (<b>, <div ...>, <wbr/>, ...)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+@click.command()
+@click.argument("origin")
+@click.argument("destination")
+@mode_option
+@click.option("--waypoints", help="Waypoints (pipe-separated or comma-separated)")
+@click.option("--alternatives", is_flag=True, help="Return alternative routes")
+@click.option("--avoid", type=AVOID_CHOICE, help="Avoid specific route features")
+@language_option
+@units_option
+@json_option
+@no_cache_option
+@account_option
+@handle_errors
+def directions(origin, destination, mode, waypoints, alternatives, avoid, language, units, json_output, no_cache, account):
+    """Get directions between two points."""
+    api = get_api(account)
+    routes = api.get_directions(
+        origin, destination, mode=mode, waypoints=waypoints,
+        alternatives=alternatives, avoid=avoid, language=language, units=units,
+        no_cache=no_cache
+    )
+    
+    if json_output:
+        emit_json(routes)
+        return
+    
+    if not routes:
+        click.echo("No routes found.")
+        return
+    
+    for route_idx, route in enumerate(routes, 1):
+        if len(routes) > 1:
+            click.echo(f"\n--- Route {route_idx} ---\n")
+        
+        summary = route.get("summary", "")
+        legs = route.get("legs", [])
+        
+        total_distance = 0
+        total_duration = 0
+        
+        for leg in legs:
+            distance = leg.get("distance", {}).get("value", 0)
+            duration = leg.get("duration", {}).get("value", 0)
+            total_distance += distance
+            total_duration += duration
+        
+        click.echo(f"Route: {summary}\n"
+                   f"Total Distance: {format_distance(total_distance)}\n"
+                   f"Total Duration: {format_duration(total_duration)}\n")
+        
+        for leg_idx, leg in enumerate(legs, 1):
+            start_address = leg.get("start_address", "")
+            end_address = leg.get("end_address", "")
+            distance = leg.get("distance", {}).get("value", 0)
+            duration = leg.get("duration", {}).get("value", 0)
+            steps = leg.get("steps", [])
+            
+            lines = [f"Leg {leg_idx}:"] if len(legs) > 1 else []
+            lines.append(f"  From: {start_address}")
+            lines.append(f"  To: {end_address}")
+            lines.append(f"  Distance: {format_distance(distance)}")
+            lines.append(f"  Duration: {format_duration(duration)}")
+            lines.append("")
+            
+            if steps:
+                lines.append("  Steps:")
+                for step in steps[:10]:  # Show first 10 steps
+                    instruction = html.unescape(_TAG_RE.sub("", step.get("html_instructions", "")))
+                    step_distance = step.get("distance", {}).get("value", 0)
+                    step_duration = step.get("duration", {}).get("value", 0)
+                    lines.append(f"    • {instruction}")
+                    lines.append(f"      {format_distance(step_distance)} / {format_duration(step_duration)}")
+                if len(steps) > 10:
+                    lines.append(f"    ... and {len(steps) - 10} more steps")
+                lines.append("")
+            click.echo("\n".join(lines))
+
+
+@click.command()
+@click.argument("origin")
+@click.argument("destination")
+@mode_option
+@no_cache_option
+@account_option
+@handle_errors
+def route(origin, destination, mode, no_cache, account):
+    """Get simplified route summary."""
+    api = get_api(account)
+    routes = api.get_directions(origin, destination, mode=mode, no_cache=no_cache)
+    
+    if not routes:
+        click.echo("No route found.")
+        return
+    
+    route = routes[0]
+    legs = route.get("legs", [])
+    
+    total_distance = 0
+    total_duration = 0
+    
+    for leg in legs:
+        total_distance += leg.get("distance", {}).get("value", 0)
+        total_duration += leg.get("duration", {}).get("value", 0)
+    
+    click.echo(f"Distance: {format_distance(total_distance)}")
+    click.echo(f"Duration: {format_duration(total_duration)}")
+    click.echo(f"Mode: {mode}")
+
+
+@click.command()
+@click.argument("origins")
+@click.argument("destinations")
+@mode_option
+@units_option
+@click.option("--parallel", type=click.IntRange(min=1), default=8, show_default=True, help="Concurrent requests for matrices split into tiles")
+@json_option
+@no_cache_option
+@account_option
+@handle_errors
+def distance(origins, destinations, mode, units, parallel, json_output, no_cache, account):
+    """Calculate distances between multiple points."""
+    api = get_api(account)
+    result = api.get_distance_matrix(parse_locations(origins), parse_locations(destinations),
+                                     mode=mode, units=units, no_cache=no_cache,
+                                     max_workers=parallel)
+    
+    if json_output:
+        emit_json(result)
+        return
+    
+    rows = result.get("rows", [])
+    origin_addresses = result.get("origin_addresses", [])
+    destination_addresses = result.get("destination_addresses", [])
+    
+    if not rows:
+        click.echo("No results found.")
+        return
+    
+    click.echo("Distance Matrix:\n")
+    
+    for i, row in enumerate(rows):
+        origin = origin_addresses[i] if i < len(origin_addresses) else f"Origin {i+1}"
+        lines = [f"From: {origin}"]
+        
+        elements = row.get("elements", [])
+        for j, element in enumerate(elements):
+            destination = destination_addresses[j] if j < len(destination_addresses) else f"Destination {j+1}"
+            status = element.get("status", "")
+            
+            if status == "OK":
+                distance = element.get("distance", {}).get("value", 0)
+                duration = element.get("duration", {}).get("value", 0)
+                lines.append(f"  To: {destination}")
+                lines.append(f"    Distance: {format_distance(distance)}")
+                lines.append(f"    Duration: {format_duration(duration)}")
+            else:
+                lines.append(f"  To: {destination}")
+                lines.append(f"    Status: {status}")
+        click.echo("\n".join(lines) + "\n")
+
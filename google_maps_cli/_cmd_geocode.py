@@ -0,0 +1,102 @@
+"""Geocoding commands for Google Maps CLI."""
+
+import click
+from .utils import json_dumps, parse_coordinates
+from ._cmd_common import (
+    account_option, emit_json, format_record, get_api, handle_errors, json_option,
+    language_option, no_cache_option, record_location, region_option,
+)
+
+# Lines shown under each geocoding result; a getter returning None skips the line
+_PLACE_ID_FIELD = ("Place ID", lambda result: result.get("place_id") or None)
+_GEOCODE_FIELDS = (("Coordinates", record_location), _PLACE_ID_FIELD)
+_REVERSE_FIELDS = (_PLACE_ID_FIELD,)
+
+
+@click.command()
+@click.argument("address")
+@language_option
+@region_option
+@json_option
+@no_cache_option
+@account_option
+@handle_errors
+def geocode(address, language, region, json_output, no_cache, account):
+    """Convert address to coordinates."""
+    api = get_api(account)
+    results = api.geocode(address, language=language, region=region, no_cache=no_cache)
+    
+    if json_output:
+        emit_json(results)
+        return
+    
+    if not results:
+        click.echo("Address not found.")
+        return
+    
+    for i, result in enumerate(results, 1):
+        click.echo(format_record(f"{i}. {result.get('formatted_address', '')}", result,
+                                 _GEOCODE_FIELDS))
+
+
+@click.command()
+@click.argument("coordinates")
+@language_option
+@json_option
+@no_cache_option
+@account_option
+@handle_errors
+def reverse(coordinates, language, json_output, no_cache, account):
+    """Convert coordinates to address."""
+    lat, lng = parse_coordinates(coordinates)
+    api = get_api(account)
+    results = api.reverse_geocode(lat, lng, language=language, no_cache=no_cache)
+    
+    if json_output:
+        emit_json(results)
+        return
+    
+    if not results:
+        click.echo("No address found for coordinates.")
+        return
+    
+    for i, result in enumerate(results, 1):
+        click.echo(format_record(f"{i}. {result.get('formatted_address', '')}", result,
+                                 _REVERSE_FIELDS))
+
+
+@click.command(name="geocode-batch")
+@click.argument("input_file", type=click.File("r"), default="-")
+@click.option("--parallel", type=click.IntRange(min=1), default=8, show_default=True, help="Concurrent requests")
+@click.option("--rate", type=click.IntRange(min=1), default=50, show_default=True, help="Maximum requests per second")
+@language_option
+@region_option
+@no_cache_option
+@account_option
+@handle_errors
+def geocode_batch(input_file, parallel, rate, language, region, no_cache, account):
+    """Geocode addresses, one per line, from a file or stdin.
+    
+    Writes one JSON object per input line (JSON Lines), in input order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from .ratelimit import TokenBucket
+    
+    addresses = [line.strip() for line in input_file if line.strip()]
+    api = get_api(account)
+    bucket = TokenBucket(rate, rate)
+    
+    def lookup(address):
+        bucket.acquire()
+        try:
+            results = api.geocode(address, language=language, region=region, no_cache=no_cache)
+            return {"address": address, "results": results}
+        except Exception as e:
+            return {"address": address, "error": str(e)}
+    
+    # map() yields in input order, so lines are written as soon as each prefix is done
+    out = click.get_binary_stream("stdout")
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        for record in executor.map(lookup, addresses):
+            out.write(json_dumps(record) + b"\n")
+            out.flush()
@@ -0,0 +1,276 @@
+"""Places commands for Google Maps CLI."""
+
+import click
+import sys
+from .utils import format_coordinates
+from ._cmd_common import (
+    OUTPUT_CHOICE, account_option, emit_json, format_record, get_api, handle_errors,
+    json_option, language_option, no_cache_option, record_location, region_option,
+)
+
+# Lines shown under each search/nearby result; a getter returning None skips the line
+_PLACE_FIELDS = (
+    ("Place ID", lambda place: place.get("place_id", "")),
+    ("Rating", lambda place: f"{place['rating']:.1f}/5.0" if place.get("rating") else None),
+    ("Address", lambda place: place.get("formatted_address") or place.get("vicinity") or None),
+    ("Location", record_location),
+)
+
+# Detail fields the human-readable `place` output shows; --json gets the API defaults
+_PLACE_DISPLAY_FIELDS = (
+    "name,formatted_address,formatted_phone_number,website,rating,"
+    "user_ratings_total,geometry/location,opening_hours,types,reviews"
+)
+
+# Keys a saved-places response may hold its item list under, in priority order
+_SAVED_ITEMS_KEYS = ("items", "lists", "savedPlaces", "places")
+_MISSING = object()
+
+# Alternative spellings of saved-item fields, in priority order
+_NAME_KEYS = ("name", "title", "displayName")
+_PLACE_ID_KEYS = ("place_id", "placeId")
+_ADDRESS_KEYS = ("formatted_address", "address")
+
+
+def _first_value(item, keys, default=""):
+    """Return the first truthy value among item's keys, or default."""
+    get = item.get
+    for key in keys:
+        value = get(key)
+        if value:
+            return value
+    return default
+
+
+@click.command()
+@click.argument("query")
+@click.option("--max", "-m", default=10, help="Maximum number of results")
+@click.option("--location", "-l", help="Location bias (lat,lng)")
+@click.option("--radius", "-r", type=int, help="Radius in meters")
+@click.option("--type", "-t", help="Place type filter")
+@language_option
+@region_option
+@json_option
+@click.option("--output", type=OUTPUT_CHOICE, default="full", help="Output format")
+@no_cache_option
+@account_option
+@handle_errors
+def search(query, max, location, radius, type, language, region, json_output, output, no_cache, account):
+    """Search for places using text query."""
+    api = get_api(account)
+    results = api.search_places(
+        query, location=location, radius=radius, type=type,
+        language=language, region=region, max_results=max, no_cache=no_cache
+    )
+    
+    if json_output:
+        emit_json(results)
+        return
+    
+    if not results:
+        click.echo("No places found.")
+        return
+    
+    click.echo(f"Found {len(results)} places:\n")
+    
+    for i, place in enumerate(results, 1):
+        if output == "keys":
+            click.echo(place.get("place_id", ""))
+        else:
+            click.echo(format_record(f"{i}. {place.get('name', 'Unknown')}", place, _PLACE_FIELDS))
+
+
+@click.command()
+@click.option("--location", "-l", required=True, help="Location (lat,lng)")
+@click.option("--radius", "-r", default=1000, type=int, help="Radius in meters")
+@click.option("--type", "-t", help="Place type filter")
+@click.option("--keyword", "-k", help="Keyword filter")
+@click.option("--max", "-m", default=10, help="Maximum number of results")
+@click.option("--open-now", is_flag=True, help="Only show places open now")
+@json_option
+@account_option
+@handle_errors
+def nearby(location, radius, type, keyword, max, open_now, json_output, account):
+    """Find places near a location."""
+    api = get_api(account)
+    results = api.nearby_search(
+        location, radius=radius, type=type, keyword=keyword,
+        open_now=open_now, max_results=max
+    )
+    
+    if json_output:
+        emit_json(results)
+        return
+    
+    if not results:
+        click.echo("No places found nearby.")
+        return
+    
+    click.echo(f"Found {len(results)} places nearby:\n")
+    
+    for i, place in enumerate(results, 1):
+        click.echo(format_record(f"{i}. {place.get('name', 'Unknown')}", place, _PLACE_FIELDS))
+
+
+@click.command()
+@click.argument("place_id")
+@click.option("--fields", help="Comma-separated list of fields to return ('*' for all)")
+@language_option
+@json_option
+@no_cache_option
+@account_option
+@handle_errors
+def place(place_id, fields, language, json_output, no_cache, account):
+    """Get detailed information about a place."""
+    if not fields and not json_output:
+        fields = _PLACE_DISPLAY_FIELDS
+    api = get_api(account)
+    details = api.get_place_details(place_id, fields=fields, language=language,
+                                    no_cache=no_cache)
+    
+    if json_output:
+        emit_json(details)
+        return
+    
+    if not details:
+        click.echo("Place not found.")
+        return
+    
+    name = details.get("name", "Unknown")
+    address = details.get("formatted_address", "")
+    phone = details.get("formatted_phone_number", "")
+    website = details.get("website", "")
+    rating = details.get("rating")
+    total_ratings = details.get("user_ratings_total")
+    geometry = details.get("geometry", {}).get("location", {})
+    lat = geometry.get("lat")
+    lng = geometry.get("lng")
+    opening_hours = details.get("opening_hours", {})
+    open_now = opening_hours.get("open_now")
+    types = details.get("types", [])
+    reviews = details.get("reviews", [])
+    
+    lines = [f"📍 {name}", f"   Place ID: {place_id}"]
+    if address:
+        lines.append(f"   Address: {address}")
+    if phone:
+        lines.append(f"   Phone: {phone}")
+    if website:
+        lines.append(f"   Website: {website}")
+    if rating:
+        lines.append(f"   Rating: {rating:.1f}/5.0")
+        if total_ratings:
+            lines.append(f"   Total Reviews: {total_ratings}")
+    if lat and lng:
+        lines.append(f"   Location: {format_coordinates(lat, lng)}")
+    if open_now is not None:
+        status = "Open" if open_now else "Closed"
+        lines.append(f"   Status: {status}")
+    if types:
+        lines.append(f"   Types: {', '.join(types[:5])}")
+    if reviews:
+        lines.append(f"\n   Reviews ({len(reviews)}):")
+        for review in reviews[:3]:
+            author = review.get("author_name", "Anonymous")
+            rating = review.get("rating")
+            text = review.get("text", "")[:200]
+            lines.append(f"   • {author} ({rating}/5): {text}...")
+    click.echo("\n".join(lines))
+
+
+@click.command()
+@click.argument("input_text")
+@click.option("--location", "-l", help="Location bias (lat,lng)")
+@click.option("--radius", "-r", type=int, help="Radius in meters")
+@language_option
+@region_option
+@json_option
+@no_cache_option
+@account_option
+@handle_errors
+def autocomplete(input_text, location, radius, language, region, json_output, no_cache, account):
+    """Get place autocomplete suggestions."""
+    api = get_api(account)
+    predictions = api.place_autocomplete(
+        input_text, location=location, radius=radius,
+        language=language, region=region, no_cache=no_cache
+    )
+    
+    if json_output:
+        emit_json(predictions)
+        return
+    
+    if not predictions:
+        click.echo("No suggestions found.")
+        return
+    
+    click.echo(f"Found {len(predictions)} suggestions:\n")
+    
+    for i, pred in enumerate(predictions, 1):
+        description = pred.get("description", "")
+        place_id = pred.get("place_id", "")
+        click.echo(f"{i}. {description}")
+        if place_id:
+            click.echo(f"   Place ID: {place_id}")
+        click.echo()
+
+
+@click.command()
+@click.option("--json-output", is_flag=True, help="Output as JSON")
+@account_option
+def lists(json_output, account):
+    """List all your saved Google Maps lists/places (requires OAuth)."""
+    try:
+        api = get_api(account, use_oauth=True)
+        saved_data = api.get_saved_places()
+        
+        if json_output:
+            emit_json(saved_data)
+            return
+        
+        # Try to parse and display the data
+        items = _MISSING
+        if isinstance(saved_data, list):
+            items = saved_data
+        elif isinstance(saved_data, dict):
+            for key in _SAVED_ITEMS_KEYS:
+                items = saved_data.get(key, _MISSING)
+                if items is not _MISSING:
+                    break
+        
+        if items is _MISSING:
+            # Unrecognized shape: display the raw data structure
+            click.echo("📋 Saved Places Data:")
+            emit_json(saved_data)
+            return
+        
+        count = len(items or ())  # items may be null in the response
+        if not count:
+            click.echo("No saved places found.")
+            return
+        
+        # Build the whole listing and write it once
+        out = [f"Found {count} saved items:", ""]
+        out_append = out.append
+        for i, item in enumerate(items, 1):
+            if isinstance(item, dict):
+                name = _first_value(item, _NAME_KEYS, "Unnamed")
+                place_id = _first_value(item, _PLACE_ID_KEYS)
+                address = _first_value(item, _ADDRESS_KEYS)
+                
+                out_append(f"{i}. {name}")
+                if place_id:
+                    out_append(f"   Place ID: {place_id}")
+                if address:
+                    out_append(f"   Address: {address}")
+            else:
+                out_append(f"{i}. {item}")
+            out_append("")
+        click.echo("\n".join(out))
+    
+    except Exception as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        click.echo("\nNote: This feature requires OAuth authentication.")
+        click.echo("Run 'maps init --oauth' to set up OAuth.")
+        sys.exit(1)
+
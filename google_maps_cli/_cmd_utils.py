@@ -0,0 +1,117 @@
+"""Utility commands for Google Maps CLI."""
+
+import click
+from .utils import format_coordinates, parse_coordinates
+from ._cmd_common import (
+    account_option, emit_json, get_api, handle_errors, json_option, no_cache_option,
+    parse_locations,
+)
+
+
+@click.command()
+@click.argument("coordinates")
+@click.option("--timestamp", type=int, help="Unix timestamp (defaults to current time)")
+@json_option
+@no_cache_option
+@account_option
+@handle_errors
+def timezone(coordinates, timestamp, json_output, no_cache, account):
+    """Get timezone information for coordinates."""
+    lat, lng = parse_coordinates(coordinates)
+    api = get_api(account)
+    result = api.get_timezone(lat, lng, timestamp=timestamp, no_cache=no_cache)
+    
+    if json_output:
+        emit_json(result)
+        return
+    
+    if result.get("status") != "OK":
+        click.echo(f"Error: {result.get('errorMessage', 'Unknown error')}")
+        return
+    
+    timezone_id = result.get("timeZoneId", "")
+    timezone_name = result.get("timeZoneName", "")
+    raw_offset = result.get("rawOffset", 0)
+    dst_offset = result.get("dstOffset", 0)
+    
+    click.echo(f"Timezone: {timezone_id}")
+    click.echo(f"Name: {timezone_name}")
+    click.echo(f"UTC Offset: {raw_offset / 3600:.1f} hours")
+    if dst_offset != raw_offset:
+        click.echo(f"DST Offset: {dst_offset / 3600:.1f} hours")
+
+
+@click.command()
+@click.argument("locations")
+@click.option("--samples", type=int, help="Number of samples for path")
+@click.option("--parallel", type=click.IntRange(min=1), default=6, show_default=True, help="Concurrent requests for long location lists")
+@json_option
+@no_cache_option
+@account_option
+@handle_errors
+def elevation(locations, samples, parallel, json_output, no_cache, account):
+    """Get elevation data for locations."""
+    location_list = parse_locations(locations)
+    api = get_api(account)
+    results = api.get_elevation(location_list, samples=samples, no_cache=no_cache,
+                                max_workers=parallel)
+    
+    if json_output:
+        emit_json(results)
+        return
+    
+    if not results:
+        click.echo("No elevation data found.")
+        return
+    
+    click.echo(f"Elevation Data ({len(results)} points):\n")
+    
+    for i, result in enumerate(results, 1):
+        location = result.get("location", {})
+        lat = location.get("lat")
+        lng = location.get("lng")
+        elevation = result.get("elevation", 0)
+        resolution = result.get("resolution", 0)
+        
+        lines = [f"{i}. Location: {format_coordinates(lat, lng)}",
+                 f"   Elevation: {elevation:.2f}m"]
+        if resolution:
+            lines.append(f"   Resolution: {resolution:.2f}m")
+        click.echo("\n".join(lines) + "\n")
+
+
+@click.command(name="open")
+@click.argument("location")
+@account_option
+@handle_errors
+def open_location(location, account):
+    """Open location in Google Maps (browser)."""
+    import webbrowser
+    from urllib.parse import quote, urlencode
+    
+    # Try to parse as coordinates first
+    try:
+        lat, lng = parse_coordinates(location)
+        url = f"https://www.google.com/maps?q={lat},{lng}"
+    except ValueError:
+        # Treat as address or place ID
+        url = "https://www.google.com/maps/search/?" + urlencode(
+            {"api": 1, "query": location}, quote_via=quote
+        )
+    
+    click.echo(f"Opening: {url}")
+    webbrowser.open(url)
+
+
+@click.group()
+def cache():
+    """Manage the local API response cache."""
+
+
+@cache.command(name="clear")
+def cache_clear():
+    """Delete all cached API responses."""
+    from .cache import ResponseCache
+    ResponseCache().clear()
+    click.echo("✅ Response cache cleared.")
+
@@ -0,0 +1,302 @@
+"""Asynchronous Google Maps Platform API wrapper."""
+
+import asyncio
+import functools
+import json
+
+from .api import MapsAPI, _merge_matrix_tiles, _split_locations
+
+
+class AsyncMapsAPI:
+    """Asyncio front-end for MapsAPI operations."""
+    
+    MAX_CONCURRENCY = 10
+    
+    def __init__(self, account=None, use_oauth=False, max_concurrency=None):
+        """
+        Initialize async Maps API client.
+        
+        Args:
+            account: Account name (optional). If None, uses default account.
+            use_oauth: If True, use OAuth instead of API key
+            max_concurrency: Maximum number of in-flight requests
+        """
+        self._api = MapsAPI(account, use_oauth=use_oauth)
+        self._max_concurrency = max_concurrency or self.MAX_CONCURRENCY
+        self._sem = None
+        self._inflight = {}  # Call key -> Task for calls in progress
+    
+    def _semaphore(self):
+        """Get the request semaphore, creating it inside the running loop."""
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self._max_concurrency)
+        return self._sem
+    
+    def close(self):
+        """Close the wrapped client's HTTP session."""
+        self._api.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    async def _run(self, func, *args, **kwargs):
+        """
+        Run a blocking MapsAPI method on the default executor.
+        
+        Identical calls already in flight are coalesced: later callers await
+        the first call's task instead of occupying another worker thread.
+        """
+        key = (func, json.dumps([args, kwargs], sort_keys=True, default=str))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._execute(func, args, kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield the shared task so one caller being cancelled doesn't cancel the rest
+        return await asyncio.shield(task)
+    
+    async def _execute(self, func, args, kwargs):
+        """Call func on the default executor, within the concurrency limit."""
+        loop = asyncio.get_running_loop()
+        async with self._semaphore():
+            return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+    
+    async def _make_request(self, endpoint, params=None, no_cache=False):
+        """
+        Make HTTP request to Google Maps API without blocking the event loop.
+        
+        The request runs on the default executor over the wrapped client's
+        pooled session, so concurrent coroutines overlap their network I/O.
+        
+        Args:
+            endpoint: API endpoint path (e.g., '/place/textsearch/json')
+            params: Query parameters dict
+            no_cache: If True, bypass the response cache
+        
+        Returns:
+            JSON response data
+        """
+        return await self._run(self._api._make_request, endpoint, params, no_cache=no_cache)
+    
+    async def _paginate(self, endpoint, params, max_results):
+        """
+        Yield pages of results, following next_page_token.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters dict for the first page
+            max_results: Maximum number of results across all pages
+        
+        Yields:
+            Lists of place results
+        """
+        data = await self._make_request(endpoint, params)
+        remaining = max_results
+        
+        while True:
+            page = data.get("results", [])[:remaining]
+            remaining -= len(page)
+            yield page
+            
+            token = data.get("next_page_token")
+            if not token or remaining <= 0:
+                return
+            
+            await asyncio.sleep(2)  # Required delay for next_page_token
+            data = await self._make_request(endpoint, dict(params, pagetoken=token))
+    
+    # Places API Methods
+    
+    async def search_places(self, query, location=None, radius=None, type=None,
+                            language=None, region=None, max_results=20):
+        """Text search for places. See MapsAPI.search_places."""
+        params = MapsAPI._text_search_params(query, location, radius, type,
+                                             language, region)
+        results = []
+        async for page in self._paginate("/place/textsearch/json", params, max_results):
+            results.extend(page)
+        return results
+    
+    async def search_places_many(self, queries, **kwargs):
+        """
+        Run multiple text searches concurrently.
+        
+        Each search still waits 2 seconds between pages, but while one query
+        waits for its next_page_token to activate the others keep fetching.
+        
+        Args:
+            queries: Iterable of search query strings
+            **kwargs: Options passed through to search_places
+        
+        Returns:
+            List of result lists, in input order
+        """
+        return await asyncio.gather(*(self.search_places(q, **kwargs) for q in queries))
+    
+    async def search_and_enrich(self, query, fields=None, location=None,
+                                radius=None, type=None, language=None,
+                                region=None, max_results=20):
+        """
+        Text search for places and fetch full details for every result.
+        
+        Detail lookups for each page start as soon as the page arrives, so
+        they run during the 2 second wait before the next page can be fetched.
+        
+        Args:
+            query: Search query string
+            fields: Detail fields to request (see MapsAPI.get_place_details)
+            location: Optional lat,lng for location bias
+            radius: Optional radius in meters
+            type: Optional place type filter
+            language: Optional language code
+            region: Optional region code
+            max_results: Maximum number of results
+        
+        Returns:
+            List of place detail dicts, in search result order; results
+            without a place ID are skipped
+        """
+        params = MapsAPI._text_search_params(query, location, radius, type,
+                                             language, region)
+        tasks = []
+        async for page in self._paginate("/place/textsearch/json", params, max_results):
+            tasks.extend(
+                asyncio.ensure_future(self.get_place_details(
+                    place["place_id"], fields=fields, language=language, region=region
+                ))
+                for place in page
+                if place.get("place_id")  # Results without an ID can't be enriched
+            )
+        return await asyncio.gather(*tasks)
+    
+    async def nearby_search(self, location, radius=1000, type=None, keyword=None,
+                            language=None, min_price=None, max_price=None,
+                            open_now=False, rank_by=None, max_results=20):
+        """Search for places near a location. See MapsAPI.nearby_search."""
+        params = MapsAPI._nearby_search_params(location, radius, type, keyword,
+                                               language, min_price, max_price,
+                                               open_now, rank_by)
+        results = []
+        async for page in self._paginate("/place/nearbysearch/json", params, max_results):
+            results.extend(page)
+        return results
+    
+    async def get_place_details(self, place_id, **kwargs):
+        """Get detailed information about a place. See MapsAPI.get_place_details."""
+        return await self._run(self._api.get_place_details, place_id, **kwargs)
+    
+    async def place_autocomplete(self, input_text, **kwargs):
+        """Get place autocomplete suggestions. See MapsAPI.place_autocomplete."""
+        return await self._run(self._api.place_autocomplete, input_text, **kwargs)
+    
+    def get_place_photo(self, photo_reference, max_width=None, max_height=None):
+        """Get place photo URL. Builds the URL locally, so it is not a coroutine."""
+        return self._api.get_place_photo(photo_reference, max_width, max_height)
+    
+    # Geocoding API Methods
+    
+    async def geocode(self, address, **kwargs):
+        """Geocode an address to coordinates. See MapsAPI.geocode."""
+        return await self._run(self._api.geocode, address, **kwargs)
+    
+    async def reverse_geocode(self, lat, lng, **kwargs):
+        """Reverse geocode coordinates to address. See MapsAPI.reverse_geocode."""
+        return await self._run(self._api.reverse_geocode, lat, lng, **kwargs)
+    
+    async def geocode_many(self, addresses, **kwargs):
+        """
+        Geocode multiple addresses concurrently.
+        
+        Args:
+            addresses: Iterable of address strings
+            **kwargs: Options passed through to geocode
+        
+        Returns:
+            List of geocoding result lists, in input order
+        """
+        return await asyncio.gather(*(self.geocode(a, **kwargs) for a in addresses))
+    
+    async def reverse_geocode_many(self, coordinates, **kwargs):
+        """
+        Reverse geocode multiple coordinates concurrently.
+        
+        Args:
+            coordinates: Iterable of (lat, lng) tuples
+            **kwargs: Options passed through to reverse_geocode
+        
+        Returns:
+            List of reverse geocoding result lists, in input order
+        """
+        return await asyncio.gather(*(self.reverse_geocode(lat, lng, **kwargs)
+                                      for lat, lng in coordinates))
+    
+    # Directions API Methods
+    
+    async def get_directions(self, origin, destination, **kwargs):
+        """Get directions between two locations. See MapsAPI.get_directions."""
+        return await self._run(self._api.get_directions, origin, destination, **kwargs)
+    
+    async def get_distance_matrix(self, origins, destinations, no_cache=False, **kwargs):
+        """
+        Calculate distances and travel times between multiple points.
+        
+        Matrices larger than Google's per-request limits are split into tiles
+        that are fetched concurrently and stitched back together.
+        
+        Args:
+            origins: List of origin addresses/coordinates (or pipe-separated string)
+            destinations: List of destination addresses/coordinates (or pipe-separated string)
+            no_cache: If True, bypass the response cache
+            **kwargs: Travel options (mode, units, departure_time, ...),
+                see MapsAPI.get_distance_matrix
+        
+        Returns:
+            Distance matrix response
+        """
+        origins = _split_locations(origins)
+        destinations = _split_locations(destinations)
+        params = MapsAPI._distance_matrix_params(**kwargs)
+        tiles, tile_params = MapsAPI._matrix_tiles(origins, destinations, params)
+        
+        responses = await asyncio.gather(*(
+            self._make_request("/distancematrix/json", p, no_cache=no_cache)
+            for p in tile_params
+        ))
+        if len(tiles) == 1:
+            return responses[0]
+        return _merge_matrix_tiles(tiles, responses, len(origins), len(destinations))
+    
+    # Other APIs
+    
+    async def get_timezone(self, lat, lng, **kwargs):
+        """Get time zone for a location. See MapsAPI.get_timezone."""
+        return await self._run(self._api.get_timezone, lat, lng, **kwargs)
+    
+    async def get_elevation(self, locations, samples=None, no_cache=False):
+        """
+        Get elevation data for locations.
+        
+        Long location lists are split into chunks that are fetched
+        concurrently and cached independently.
+        
+        Args:
+            locations: List of lat,lng coordinates (or pipe-separated string)
+            samples: Optional number of samples for path
+            no_cache: If True, bypass the response cache
+        
+        Returns:
+            List of elevation results
+        """
+        size = MapsAPI.ELEVATION_CHUNK_SIZE
+        if isinstance(locations, list) and not samples and len(locations) > size:
+            pages = await asyncio.gather(*(
+                self.get_elevation(locations[i:i + size], no_cache=no_cache)
+                for i in range(0, len(locations), size)
+            ))
+            return [result for page in pages for result in page]
+        
+        return await self._run(self._api.get_elevation, locations,
+                               samples=samples, no_cache=no_cache)
@@ -1,7 +1,115 @@
 """Google Maps Platform API wrapper."""
 
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote, urlencode
+
 import requests
-from .auth import get_api_key, check_auth, get_oauth_credentials
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from . import __version__
+from .auth import (
+    get_api_key, check_auth, get_oauth_credentials, _get_request_class,
+    save_oauth_credentials, load_saved_places_endpoint, save_saved_places_endpoint
+)
+from .cache import ResponseCache, get_ttl, make_key, parse_max_age
+from .errors import APIError, AuthError, MapsError, QuotaError, TransientError
+from .ratelimit import TokenBucket, retry
+from .utils import json_loads
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:  # Python < 3.9
+    ZoneInfo = None
+
+# Pooled HTTP session shared by every MapsAPI instance in the process
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+def _compact(pairs):
+    """
+    Build a params dict from (name, value) pairs, skipping unset values.
+    
+    Args:
+        pairs: Iterable of (name, value) tuples
+    
+    Returns:
+        Dict of the pairs whose value is not None or empty
+    """
+    return {name: value for name, value in pairs if value is not None and value != ""}
+
+
+def _format_location(location):
+    """
+    Format a location for a query parameter.
+    
+    Args:
+        location: Address/"lat,lng" string or (lat, lng) pair of numbers
+    
+    Returns:
+        Location string
+    """
+    if isinstance(location, str):
+        return location
+    lat, lng = location
+    return f"{lat},{lng}"
+
+
+def _split_locations(locations):
+    """
+    Normalize locations to a list.
+    
+    Args:
+        locations: List of addresses/coordinates ("lat,lng" strings or
+            (lat, lng) pairs) or pipe-separated string
+    
+    Returns:
+        List of location strings
+    """
+    if not isinstance(locations, str):
+        return [_format_location(location) for location in locations]
+    if locations.startswith("enc:"):
+        return [locations]  # Encoded polylines may contain '|'
+    return locations.split("|")
+
+
+def _merge_matrix_tiles(tiles, responses, num_origins, num_destinations):
+    """
+    Stitch tiled Distance Matrix responses into a single response.
+    
+    Args:
+        tiles: List of (origin offset, destination offset) tuples
+        responses: Distance Matrix responses, one per tile
+        num_origins: Total number of origins
+        num_destinations: Total number of destinations
+    
+    Returns:
+        Distance matrix response covering all origins and destinations
+    """
+    origin_addresses = [""] * num_origins
+    destination_addresses = [""] * num_destinations
+    # Cells a short or failed tile leaves unfilled read as NOT_FOUND
+    rows = [{"elements": [{"status": "NOT_FOUND"} for _ in range(num_destinations)]}
+            for _ in range(num_origins)]
+    
+    for (row, col), data in zip(tiles, responses):
+        for i, address in enumerate(data.get("origin_addresses", [])):
+            origin_addresses[row + i] = address
+        for j, address in enumerate(data.get("destination_addresses", [])):
+            destination_addresses[col + j] = address
+        for i, tile_row in enumerate(data.get("rows", [])):
+            elements = tile_row.get("elements", [])
+            rows[row + i]["elements"][col:col + len(elements)] = elements
+    
+    return {
+        "status": "OK",
+        "origin_addresses": origin_addresses,
+        "destination_addresses": destination_addresses,
+        "rows": rows,
+    }
 
 
 class MapsAPI:
@@ -9,6 +117,65 @@ class MapsAPI:
     
     BASE_URL = "https://maps.googleapis.com/maps/api"
     USER_DATA_BASE_URL = "https://www.googleapis.com"  # For user-specific data
+    ENDPOINTS = (
+        "/place/textsearch/json",
+        "/place/nearbysearch/json",
+        "/place/details/json",
+        "/place/autocomplete/json",
+        "/geocode/json",
+        "/directions/json",
+        "/distancematrix/json",
+        "/timezone/json",
+        "/elevation/json",
+    )
+    # Full URLs for the fixed endpoints, built once instead of per request
+    _URLS = dict(zip(ENDPOINTS, map(BASE_URL.__add__, ENDPOINTS)))
+    MAX_CONCURRENT_REQUESTS = 10  # Keeps batch calls under Google's QPS quotas
+    
+    # Refresh OAuth tokens this long before they expire
+    OAUTH_REFRESH_MARGIN = timedelta(seconds=60)
+    MATRIX_MAX_ELEMENTS = 100  # Distance Matrix elements allowed per request
+    MATRIX_MAX_LOCATIONS = 25  # Origins or destinations allowed per request
+    MATRIX_TILE_SIZE = 10  # Origins/destinations per tile (10 x 10 = 100 elements)
+    ELEVATION_CHUNK_SIZE = 450  # Locations per request (Google caps at 512)
+    TZ_CELL_CACHE_SIZE = 4096  # Grid cells remembered by get_timezone
+    
+    # Candidate endpoints for user saved places, tried in order until one answers
+    SAVED_PLACES_ENDPOINTS = (
+        "/maps/v1/savedPlaces",
+        "/maps/v1/user/savedPlaces",
+        "/maps/v1/lists",
+        "/maps/v1/user/lists",
+        "/maps/v1/places/saved",
+        "/userinfo/v2/me",  # Fallback to user info
+    )
+    
+    # Statuses meaning a candidate endpoint does not exist or is unsupported
+    SAVED_PLACES_MISSING_STATUSES = ("HTTP_400", "HTTP_404", "HTTP_405", "HTTP_410", "HTTP_501")
+    
+    # How long to wait before probing again after no endpoint answered
+    SAVED_PLACES_RETRY_INTERVAL = 24 * 60 * 60
+    
+    # Place Details fields the CLI renders; requesting a field mask keeps
+    # responses small and avoids billing for every field by default
+    DEFAULT_DETAIL_FIELDS = (
+        "place_id,name,formatted_address,geometry/location,rating,"
+        "user_ratings_total,types,opening_hours,formatted_phone_number,"
+        "website,price_level,photos,reviews"
+    )
+    # Status codes that may succeed when retried, or that mean a quota is spent
+    TRANSIENT_STATUSES = ("OVER_QUERY_LIMIT", "UNKNOWN_ERROR")
+    QUOTA_STATUSES = ("OVER_DAILY_LIMIT",)
+    AUTH_HTTP_STATUSES = (401, 403)
+    TRANSIENT_HTTP_STATUSES = (429, 500, 502, 503, 504)
+    
+    # Shared per API family so every client in the process is paced together
+    _BUCKETS = {
+        "place": TokenBucket(10, 20),
+        "geocode": TokenBucket(50, 50),
+        "directions": TokenBucket(50, 50),
+        "default": TokenBucket(50, 50),
+    }
     
     def __init__(self, account=None, use_oauth=False):
         """
@@ -26,23 +193,117 @@ class MapsAPI:
         if use_oauth:
             self.oauth_creds = check_auth(account, use_oauth=True)
             if not self.oauth_creds:
-                raise Exception("Not authenticated with OAuth. Run 'maps init --oauth' first.")
+                raise AuthError("Not authenticated with OAuth. Run 'maps init --oauth' first.")
         else:
             self.api_key = check_auth(account, use_oauth=False)
             if not self.api_key:
                 # Try OAuth as fallback
                 self.oauth_creds = check_auth(account, use_oauth=True)
                 if not self.oauth_creds:
-                    raise Exception("Not authenticated. Run 'maps init' first.")
+                    raise AuthError("Not authenticated. Run 'maps init' first.")
+        
+        self._refresh_lock = threading.Lock()
+        self._auth_headers = {}  # Rebuilt only when the OAuth token changes
+        if self.oauth_creds:
+            self._maybe_refresh()
+            self._update_auth_headers()
+        
+        self._session = self._get_session()
+        self._request_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._cache = ResponseCache()
+        self._inflight = {}  # Request key -> Future for requests in progress
+        self._inflight_lock = threading.Lock()
+        self._tz_cells = {}  # (lat, lng) 0.1 degree cell -> time zone ID
+        self._tz_names = {}  # (time zone ID, is DST, language) -> display name
+        
+        # Photo URLs are built per result, so the fixed prefix is encoded once
+        self._photo_url = f"{self.BASE_URL}/place/photo?"
+        if self.api_key:
+            self._photo_url += f"key={quote(self.api_key, safe='')}&"
+    
+    @classmethod
+    def _get_session(cls):
+        """
+        Get the process-wide pooled session, creating it on first use.
+        
+        Clients for different accounts (and the async wrapper) all talk to the
+        same hosts, so sharing one connection pool lets each reuse the warm
+        connections the others opened.
+        
+        Returns:
+            Shared requests.Session
+        """
+        global _shared_session
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = cls._create_session()
+            return _shared_session
+    
+    @classmethod
+    def _create_session(cls):
+        """
+        Create a pooled HTTP session.
+        
+        All requests go to a handful of Google hosts, so keeping connections
+        alive avoids a TCP + TLS handshake on every call after the first.
+        The per-host pool holds one connection per allowed in-flight request,
+        and blocks rather than opening throwaway sockets when it is exhausted,
+        so concurrent batch calls always reuse warm connections.
+        
+        Returns:
+            Configured requests.Session
+        """
+        session = requests.Session()
+        # The adapter owns transport retries: refused/reset connections and
+        # 429/5xx responses (honoring Retry-After). Read timeouts are not
+        # retried, so a stalled server costs one timeout. API-level statuses
+        # in a 200 body are retried by @retry on _send, never both layers.
+        retries = Retry(total=None, connect=2, read=0, status=2, other=0,
+                        backoff_factor=0.3,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        allowed_methods=frozenset(["GET"]),
+                        respect_retry_after_header=True,
+                        raise_on_status=False)
+        session.mount("https://", HTTPAdapter(pool_connections=4,
+                                              pool_maxsize=cls.MAX_CONCURRENT_REQUESTS,
+                                              pool_block=True,
+                                              max_retries=retries))
+        session.headers.update({
+            "User-Agent": f"google-maps-cli/{__version__}",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+        })
+        return session
+    
+    def close(self):
+        """
+        Release the pooled connections.
+        
+        The session is shared, so this only closes idle sockets; any client
+        that makes another request simply opens a fresh connection.
+        """
+        self._session.close()
+    
+    def __enter__(self):
+        return self
     
-    def _make_request(self, endpoint, params=None, use_user_data_api=False):
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _make_request(self, endpoint, params=None, use_user_data_api=False,
+                      no_cache=False):
         """
         Make HTTP request to Google Maps API.
         
+        Identical requests issued concurrently (e.g. from the batch helpers)
+        are coalesced: the first caller performs the HTTP request and the
+        others wait for and share its result.
+        
         Args:
             endpoint: API endpoint path (e.g., '/place/textsearch/json')
             params: Query parameters dict
             use_user_data_api: If True, use user data API base URL
+            no_cache: If True, bypass the on-disk response cache
         
         Returns:
             JSON response data
@@ -50,74 +311,276 @@ class MapsAPI:
         if params is None:
             params = {}
         
-        base_url = self.USER_DATA_BASE_URL if use_user_data_api else self.BASE_URL
-        url = f"{base_url}{endpoint}"
+        # One sorted list of pairs serves as both the cache key input and the
+        # query string, so equal params always produce the same key and URL
+        query = sorted(params.items())
+        request_key = make_key(endpoint, query)
+        ttl = 0 if no_cache or use_user_data_api else get_ttl(endpoint, params)
+        stale = None
+        if ttl:
+            entry = self._cache.get_entry(request_key)
+            if entry is not None:
+                if entry.get("expires", 0) >= time.time():
+                    return entry.get("data")
+                if entry.get("etag"):
+                    stale = entry  # Revalidate rather than refetch
+        
+        with self._inflight_lock:
+            future = self._inflight.get(request_key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[request_key] = future
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            data, max_age, etag = self._send(endpoint, query, use_user_data_api, stale)
+            if max_age is not None:
+                ttl = min(ttl, max_age)  # The server may shorten the lifetime
+            if ttl:
+                self._cache.set(request_key, data, ttl, etag)
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[request_key]
+    
+    @retry(on=TransientError, when=lambda e: e.status in MapsAPI.TRANSIENT_STATUSES)
+    def _send(self, endpoint, query, use_user_data_api=False, stale=None):
+        """
+        Send a request over the pooled session and check the response status.
         
-        headers = {}
+        Rate limits, server-side unknown errors, timeouts and connection
+        failures raise TransientError. Only the API-level statuses
+        (OVER_QUERY_LIMIT, UNKNOWN_ERROR) are retried here; transport
+        failures were already retried by the session's adapter.
+        
+        Args:
+            endpoint: API endpoint path
+            query: Query parameters as a list of (name, value) tuples
+            use_user_data_api: If True, use user data API base URL
+            stale: Expired cache entry with an ETag to revalidate (optional)
+        
+        Returns:
+            Tuple of (JSON response data, Cache-Control max-age or None,
+            ETag or None). If the server confirms the stale entry is still
+            current, its data is returned without downloading a body.
+        """
+        if use_user_data_api:
+            url = f"{self.USER_DATA_BASE_URL}{endpoint}"
+        else:
+            url = self._URLS.get(endpoint) or f"{self.BASE_URL}{endpoint}"
         
         # Use OAuth if available
         if self.oauth_creds:
-            if not self.oauth_creds.valid:
-                if self.oauth_creds.expired and self.oauth_creds.refresh_token:
-                    from google.auth.transport.requests import Request
-                    self.oauth_creds.refresh(Request())
-            headers["Authorization"] = f"Bearer {self.oauth_creds.token}"
+            self._maybe_refresh()
         else:
             # Use API key
-            params["key"] = self.api_key
+            query = query + [("key", self.api_key)]
+        
+        headers = self._auth_headers
+        if stale:
+            headers = dict(headers, **{"If-None-Match": stale["etag"]})
+        
+        if not use_user_data_api:
+            self._rate_limit(endpoint)
         
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Check for API errors (Maps Platform format)
-            if not use_user_data_api and data.get("status") not in ["OK", "ZERO_RESULTS"]:
-                error_msg = data.get("error_message", "Unknown error")
-                status = data.get("status", "UNKNOWN_ERROR")
-                raise Exception(f"API Error ({status}): {error_msg}")
-            
-            return data
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Request failed: {e}")
+            with self._request_slots:
+                # Stream so the status is checked before any body is read;
+                # HTTP error pages are never downloaded or decoded
+                response = self._session.get(url, params=query, headers=headers,
+                                             timeout=10, stream=True)
+                try:
+                    response.raise_for_status()
+                    max_age = parse_max_age(response.headers.get("Cache-Control"))
+                    if stale and response.status_code == 304:
+                        return stale["data"], max_age, stale["etag"]
+                    data = json_loads(response.content)
+                finally:
+                    response.close()
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            raise TransientError("REQUEST_FAILED", str(e)) from e
+        except requests.exceptions.HTTPError as e:
+            code = e.response.status_code
+            if code in self.AUTH_HTTP_STATUSES:
+                raise AuthError(f"Request was not authorized: {e}") from e
+            if code in self.TRANSIENT_HTTP_STATUSES:
+                raise TransientError(f"HTTP_{code}", str(e)) from e
+            raise APIError(f"HTTP_{code}", str(e)) from e
+        except (requests.exceptions.RequestException, ValueError) as e:
+            raise MapsError(f"Request failed: {e}") from e
+        
+        # Check for API errors (Maps Platform format)
+        if not use_user_data_api and data.get("status") not in ["OK", "ZERO_RESULTS"]:
+            error_msg = data.get("error_message", "Unknown error")
+            status = data.get("status", "UNKNOWN_ERROR")
+            if status in self.TRANSIENT_STATUSES:
+                raise TransientError(status, error_msg)
+            if status in self.QUOTA_STATUSES:
+                raise QuotaError(status, error_msg)
+            raise APIError(status, error_msg)
+        
+        return data, max_age, response.headers.get("ETag")
+    
+    def _token_expiring(self):
+        """Check whether the OAuth token is missing or expires within the refresh margin."""
+        creds = self.oauth_creds
+        if not creds.token:
+            return True
+        if creds.expiry is None:
+            return False
+        # google-auth stores expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return creds.expiry - now < self.OAUTH_REFRESH_MARGIN
+    
+    def _maybe_refresh(self):
+        """
+        Refresh the OAuth token if it has expired or is about to.
+        
+        The check is repeated under a lock, so when a batch of concurrent
+        requests all notice the expiry only one of them refreshes.
+        """
+        if not self._token_expiring():
+            return
+        
+        with self._refresh_lock:
+            if not self._token_expiring() or not self.oauth_creds.refresh_token:
+                return
+            self.oauth_creds.refresh(_get_request_class()())
+            self._update_auth_headers()
+            try:
+                save_oauth_credentials(self.oauth_creds, self.account)
+            except OSError:
+                pass  # The in-memory token is still valid for this run
+    
+    def _update_auth_headers(self):
+        """Rebuild the shared request headers for the current OAuth token."""
+        self._auth_headers = {"Authorization": f"Bearer {self.oauth_creds.token}"}
+    
+    def _rate_limit(self, endpoint):
+        """
+        Wait for a rate limit token for the endpoint's API family.
+        
+        Args:
+            endpoint: API endpoint path (e.g., '/place/textsearch/json')
+        """
+        family = endpoint.split("/")[1]
+        self._BUCKETS.get(family, self._BUCKETS["default"]).acquire()
+    
+    def _map_concurrent(self, func, items, max_workers):
+        """
+        Apply func to each item concurrently over the shared session.
+        
+        Args:
+            func: Callable taking a single item
+            items: Iterable of inputs
+            max_workers: Maximum number of worker threads
+        
+        Returns:
+            List of results in input order
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
     
     def get_saved_places(self):
         """
         Get user's saved places/lists from Google Maps.
         
         Note: This endpoint may not exist. We'll try various possibilities.
+        The endpoint that answers (or the fact that every candidate was
+        rejected as missing or unsupported) is recorded in the account's
+        token file, so later calls skip the discovery probes. Auth, network
+        and other API failures are raised without touching that record.
         
         Returns:
             List of saved places or lists
         """
         if not self.oauth_creds:
-            raise Exception("OAuth authentication required for accessing saved places. Run 'maps init --oauth' first.")
-        
-        # Try different possible endpoints
-        endpoints_to_try = [
-            "/maps/v1/savedPlaces",
-            "/maps/v1/user/savedPlaces",
-            "/maps/v1/lists",
-            "/maps/v1/user/lists",
-            "/maps/v1/places/saved",
-            "/userinfo/v2/me",  # Fallback to user info
-        ]
-        
+            raise AuthError("OAuth authentication required for accessing saved places. Run 'maps init --oauth' first.")
+        
+        not_found = MapsError("Could not find API endpoint for saved places. This feature may not be available via API.")
+        
+        endpoints_to_try = self.SAVED_PLACES_ENDPOINTS
+        known = load_saved_places_endpoint(self.account)
+        if known:
+            endpoint, checked = known
+            if endpoint:
+                # Try the known endpoint first, rediscovering if it stops working
+                endpoints_to_try = (endpoint,) + tuple(
+                    e for e in endpoints_to_try if e != endpoint
+                )
+            elif time.time() - checked < self.SAVED_PLACES_RETRY_INTERVAL:
+                raise not_found
+        
+        all_missing = True
         for endpoint in endpoints_to_try:
             try:
                 data = self._make_request(endpoint, use_user_data_api=True)
-                if data:
-                    return data
-            except Exception as e:
-                # Try next endpoint
+            except TransientError:
+                raise
+            except APIError as e:
+                if e.status not in self.SAVED_PLACES_MISSING_STATUSES:
+                    raise
+                # Endpoint doesn't exist; try the next one
                 continue
-        
-        raise Exception("Could not find API endpoint for saved places. This feature may not be available via API.")
+            if data:
+                if not known or known[0] != endpoint:
+                    save_saved_places_endpoint(endpoint, self.account)
+                return data
+            all_missing = False
+        
+        if all_missing:
+            save_saved_places_endpoint(None, self.account)
+        raise not_found
     
     # Places API Methods
     
+    @staticmethod
+    def _text_search_params(query, location=None, radius=None, type=None,
+                            language=None, region=None):
+        """Build query parameters for a text search request."""
+        return {
+            "query": query,
+            **_compact((
+                ("location", location),
+                ("radius", radius),
+                ("type", type),
+                ("language", language),
+                ("region", region),
+            )),
+        }
+    
+    @staticmethod
+    def _nearby_search_params(location, radius=1000, type=None, keyword=None,
+                              language=None, min_price=None, max_price=None,
+                              open_now=False, rank_by=None):
+        """Build query parameters for a nearby search request."""
+        return {
+            "location": location,
+            "radius": radius,
+            **_compact((
+                ("type", type),
+                ("keyword", keyword),
+                ("language", language),
+                ("minprice", min_price),
+                ("maxprice", max_price),
+                ("opennow", "true" if open_now else None),
+                ("rankby", rank_by),
+            )),
+        }
+    
     def search_places(self, query, location=None, radius=None, type=None, 
-                     language=None, region=None, max_results=20):
+                     language=None, region=None, max_results=20, no_cache=False):
         """
         Text search for places.
         
@@ -129,35 +592,25 @@ class MapsAPI:
             language: Optional language code
             region: Optional region code (ccTLD)
             max_results: Maximum number of results
+            no_cache: If True, bypass the response cache
         
         Returns:
             List of place results
         """
-        params = {"query": query}
-        
-        if location:
-            params["location"] = location
-        if radius:
-            params["radius"] = radius
-        if type:
-            params["type"] = type
-        if language:
-            params["language"] = language
-        if region:
-            params["region"] = region
+        params = self._text_search_params(query, location, radius, type,
+                                          language, region)
         
         results = []
-        data = self._make_request("/place/textsearch/json", params)
+        data = self._make_request("/place/textsearch/json", params, no_cache=no_cache)
         
         if "results" in data:
             results.extend(data["results"][:max_results])
         
         # Handle pagination
         while "next_page_token" in data and len(results) < max_results:
-            import time
             time.sleep(2)  # Required delay for next_page_token
             params["pagetoken"] = data["next_page_token"]
-            data = self._make_request("/place/textsearch/json", params)
+            data = self._make_request("/place/textsearch/json", params, no_cache=no_cache)
             if "results" in data:
                 results.extend(data["results"][:max_results - len(results)])
         
@@ -184,25 +637,9 @@ class MapsAPI:
         Returns:
             List of place results
         """
-        params = {
-            "location": location,
-            "radius": radius,
-        }
-        
-        if type:
-            params["type"] = type
-        if keyword:
-            params["keyword"] = keyword
-        if language:
-            params["language"] = language
-        if min_price is not None:
-            params["minprice"] = min_price
-        if max_price is not None:
-            params["maxprice"] = max_price
-        if open_now:
-            params["opennow"] = "true"
-        if rank_by:
-            params["rankby"] = rank_by
+        params = self._nearby_search_params(location, radius, type, keyword,
+                                            language, min_price, max_price,
+                                            open_now, rank_by)
         
         results = []
         data = self._make_request("/place/nearbysearch/json", params)
@@ -212,7 +649,6 @@ class MapsAPI:
         
         # Handle pagination
         while "next_page_token" in data and len(results) < max_results:
-            import time
             time.sleep(2)
             params["pagetoken"] = data["next_page_token"]
             data = self._make_request("/place/nearbysearch/json", params)
@@ -222,37 +658,40 @@ class MapsAPI:
         return results[:max_results]
     
     def get_place_details(self, place_id, fields=None, language=None, 
-                         region=None, session_token=None):
+                         region=None, session_token=None, no_cache=False):
         """
         Get detailed information about a place.
         
         Args:
             place_id: Place ID
             fields: Optional comma-separated list of fields to return
+                (defaults to DEFAULT_DETAIL_FIELDS; "*" returns all fields)
             language: Optional language code
             region: Optional region code
             session_token: Optional session token for billing
+            no_cache: If True, bypass the response cache
         
         Returns:
-            Place details object
+            Place details object. Photo entries carry only a reference; use
+            get_place_photo to build their URLs without another request.
         """
-        params = {"place_id": place_id}
-        
-        if fields:
-            params["fields"] = fields
-        if language:
-            params["language"] = language
-        if region:
-            params["region"] = region
-        if session_token:
-            params["sessiontoken"] = session_token
+        fields = fields or self.DEFAULT_DETAIL_FIELDS
+        params = {
+            "place_id": place_id,
+            **_compact((
+                ("fields", None if fields == "*" else fields),
+                ("language", language),
+                ("region", region),
+                ("sessiontoken", session_token),
+            )),
+        }
         
-        data = self._make_request("/place/details/json", params)
+        data = self._make_request("/place/details/json", params, no_cache=no_cache)
         return data.get("result")
     
     def place_autocomplete(self, input_text, location=None, radius=None,
                           language=None, region=None, types=None,
-                          components=None, session_token=None):
+                          components=None, session_token=None, no_cache=False):
         """
         Get place autocomplete suggestions.
         
@@ -265,28 +704,25 @@ class MapsAPI:
             types: Optional type filter
             components: Optional country restriction
             session_token: Optional session token
+            no_cache: If True, bypass the response cache
         
         Returns:
             List of predictions
         """
-        params = {"input": input_text}
+        params = {
+            "input": input_text,
+            **_compact((
+                ("location", location),
+                ("radius", radius),
+                ("language", language),
+                ("region", region),
+                ("types", types),
+                ("components", components),
+                ("sessiontoken", session_token),
+            )),
+        }
         
-        if location:
-            params["location"] = location
-        if radius:
-            params["radius"] = radius
-        if language:
-            params["language"] = language
-        if region:
-            params["region"] = region
-        if types:
-            params["types"] = types
-        if components:
-            params["components"] = components
-        if session_token:
-            params["sessiontoken"] = session_token
-        
-        data = self._make_request("/place/autocomplete/json", params)
+        data = self._make_request("/place/autocomplete/json", params, no_cache=no_cache)
         return data.get("predictions", [])
     
     def get_place_photo(self, photo_reference, max_width=None, max_height=None):
@@ -301,26 +737,42 @@ class MapsAPI:
         Returns:
             Photo URL string
         """
-        params = {"photo_reference": photo_reference}
-        
         if max_width:
-            params["maxwidth"] = max_width
+            size = ("maxwidth", max_width)
         elif max_height:
-            params["maxheight"] = max_height
+            size = ("maxheight", max_height)
         else:
-            params["maxwidth"] = 400  # Default
-        
-        url = f"{self.BASE_URL}/place/photo"
-        params["key"] = self.api_key
+            size = ("maxwidth", 400)  # Default
         
         # Build URL manually since we need the redirect
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        return f"{url}?{query_string}"
+        return self._photo_url + urlencode((("photo_reference", photo_reference), size))
+    
+    def place_details_many(self, place_ids, fields=None, language=None,
+                           region=None, max_workers=8):
+        """
+        Get details for multiple places concurrently.
+        
+        Args:
+            place_ids: Iterable of place IDs
+            fields: Optional comma-separated list of fields to return
+            language: Optional language code
+            region: Optional region code
+            max_workers: Maximum number of concurrent requests
+        
+        Returns:
+            List of place details objects, in input order
+        """
+        return self._map_concurrent(
+            lambda place_id: self.get_place_details(
+                place_id, fields=fields, language=language, region=region
+            ),
+            place_ids, max_workers
+        )
     
     # Geocoding API Methods
     
     def geocode(self, address, language=None, region=None, 
-                components=None, bounds=None):
+                components=None, bounds=None, no_cache=False):
         """
         Geocode an address to coordinates.
         
@@ -330,26 +782,26 @@ class MapsAPI:
             region: Optional region code
             components: Optional component filters
             bounds: Optional viewport bounds
+            no_cache: If True, bypass the response cache
         
         Returns:
             List of geocoding results
         """
-        params = {"address": address}
+        params = {
+            "address": address,
+            **_compact((
+                ("language", language),
+                ("region", region),
+                ("components", components),
+                ("bounds", bounds),
+            )),
+        }
         
-        if language:
-            params["language"] = language
-        if region:
-            params["region"] = region
-        if components:
-            params["components"] = components
-        if bounds:
-            params["bounds"] = bounds
-        
-        data = self._make_request("/geocode/json", params)
+        data = self._make_request("/geocode/json", params, no_cache=no_cache)
         return data.get("results", [])
     
     def reverse_geocode(self, lat, lng, language=None, result_type=None,
-                       location_type=None):
+                       location_type=None, no_cache=False):
         """
         Reverse geocode coordinates to address.
         
@@ -359,29 +811,66 @@ class MapsAPI:
             language: Optional language code
             result_type: Optional result type filter
             location_type: Optional location type filter
+            no_cache: If True, bypass the response cache
         
         Returns:
             List of geocoding results
         """
-        params = {"latlng": f"{lat},{lng}"}
-        
-        if language:
-            params["language"] = language
-        if result_type:
-            params["result_type"] = result_type
-        if location_type:
-            params["location_type"] = location_type
+        params = {
+            "latlng": f"{lat},{lng}",
+            **_compact((
+                ("language", language),
+                ("result_type", result_type),
+                ("location_type", location_type),
+            )),
+        }
         
-        data = self._make_request("/geocode/json", params)
+        data = self._make_request("/geocode/json", params, no_cache=no_cache)
         return data.get("results", [])
     
+    def geocode_many(self, addresses, language=None, region=None, max_workers=8):
+        """
+        Geocode multiple addresses concurrently.
+        
+        Args:
+            addresses: Iterable of address strings
+            language: Optional language code
+            region: Optional region code
+            max_workers: Maximum number of concurrent requests
+        
+        Returns:
+            List of geocoding result lists, in input order
+        """
+        return self._map_concurrent(
+            lambda address: self.geocode(address, language=language, region=region),
+            addresses, max_workers
+        )
+    
+    def reverse_geocode_many(self, coordinates, language=None, max_workers=8):
+        """
+        Reverse geocode multiple coordinates concurrently.
+        
+        Args:
+            coordinates: Iterable of (lat, lng) tuples
+            language: Optional language code
+            max_workers: Maximum number of concurrent requests
+        
+        Returns:
+            List of geocoding result lists, in input order
+        """
+        return self._map_concurrent(
+            lambda coords: self.reverse_geocode(coords[0], coords[1], language=language),
+            coordinates, max_workers
+        )
+    
     # Directions API Methods
     
     def get_directions(self, origin, destination, mode="driving",
                       waypoints=None, alternatives=False, avoid=None,
                       language=None, units="metric", region=None,
                       departure_time=None, arrival_time=None,
-                      transit_mode=None, transit_routing_preference=None):
+                      transit_mode=None, transit_routing_preference=None,
+                      no_cache=False):
         """
         Get directions between two points.
         
@@ -399,40 +888,33 @@ class MapsAPI:
             arrival_time: Optional arrival time (Unix timestamp)
             transit_mode: Optional transit modes (bus, subway, train, tram, rail)
             transit_routing_preference: Optional preference (less_walking, fewer_transfers)
+            no_cache: If True, bypass the response cache
         
         Returns:
             Directions response with routes
         """
+        if isinstance(waypoints, list):
+            waypoints = "|".join(waypoints)
+        
         params = {
             "origin": origin,
             "destination": destination,
             "mode": mode,
+            **_compact((
+                ("waypoints", waypoints),
+                ("alternatives", "true" if alternatives else None),
+                ("avoid", avoid),
+                ("language", language),
+                ("units", units),
+                ("region", region),
+                ("departure_time", departure_time),
+                ("arrival_time", arrival_time),
+                ("transit_mode", transit_mode),
+                ("transit_routing_preference", transit_routing_preference),
+            )),
         }
         
-        if waypoints:
-            if isinstance(waypoints, list):
-                waypoints = "|".join(waypoints)
-            params["waypoints"] = waypoints
-        if alternatives:
-            params["alternatives"] = "true"
-        if avoid:
-            params["avoid"] = avoid
-        if language:
-            params["language"] = language
-        if units:
-            params["units"] = units
-        if region:
-            params["region"] = region
-        if departure_time:
-            params["departure_time"] = departure_time
-        if arrival_time:
-            params["arrival_time"] = arrival_time
-        if transit_mode:
-            params["transit_mode"] = transit_mode
-        if transit_routing_preference:
-            params["transit_routing_preference"] = transit_routing_preference
-        
-        data = self._make_request("/directions/json", params)
+        data = self._make_request("/directions/json", params, no_cache=no_cache)
         return data.get("routes", [])
     
     # Distance Matrix API Methods
@@ -441,10 +923,13 @@ class MapsAPI:
                            language=None, avoid=None, units="metric",
                            departure_time=None, arrival_time=None,
                            transit_mode=None, transit_routing_preference=None,
-                           traffic_model=None):
+                           traffic_model=None, no_cache=False, max_workers=8):
         """
         Calculate distances and travel times between multiple points.
         
+        Matrices larger than Google's per-request element limit are split
+        into tiles that are fetched concurrently and stitched back together.
+        
         Args:
             origins: List of origin addresses/coordinates (or pipe-separated string)
             destinations: List of destination addresses/coordinates (or pipe-separated string)
@@ -457,52 +942,106 @@ class MapsAPI:
             transit_mode: Optional transit modes
             transit_routing_preference: Optional preference
             traffic_model: Optional traffic model (best_guess, pessimistic, optimistic)
+            no_cache: If True, bypass the response cache
+            max_workers: Maximum number of concurrent tile requests
         
         Returns:
             Distance matrix response
         """
-        params = {
-            "origins": origins if isinstance(origins, str) else "|".join(origins),
-            "destinations": destinations if isinstance(destinations, str) else "|".join(destinations),
+        origins = _split_locations(origins)
+        destinations = _split_locations(destinations)
+        params = self._distance_matrix_params(
+            mode, language, avoid, units, departure_time, arrival_time,
+            transit_mode, transit_routing_preference, traffic_model
+        )
+        tiles, tile_params = self._matrix_tiles(origins, destinations, params)
+        
+        if len(tiles) == 1:
+            return self._make_request("/distancematrix/json", tile_params[0], no_cache=no_cache)
+        
+        responses = self._map_concurrent(
+            lambda p: self._make_request("/distancematrix/json", p, no_cache=no_cache),
+            tile_params, max_workers
+        )
+        return _merge_matrix_tiles(tiles, responses, len(origins), len(destinations))
+    
+    @staticmethod
+    def _distance_matrix_params(mode="driving", language=None, avoid=None,
+                                units="metric", departure_time=None,
+                                arrival_time=None, transit_mode=None,
+                                transit_routing_preference=None, traffic_model=None):
+        """Build the shared query parameters for a distance matrix request."""
+        return {
             "mode": mode,
+            **_compact((
+                ("language", language),
+                ("avoid", avoid),
+                ("units", units),
+                ("departure_time", departure_time),
+                ("arrival_time", arrival_time),
+                ("transit_mode", transit_mode),
+                ("transit_routing_preference", transit_routing_preference),
+                ("traffic_model", traffic_model),
+            )),
         }
+    
+    @classmethod
+    def _matrix_tiles(cls, origins, destinations, params):
+        """
+        Split a distance matrix into requests within Google's per-request limits.
         
-        if language:
-            params["language"] = language
-        if avoid:
-            params["avoid"] = avoid
-        if units:
-            params["units"] = units
-        if departure_time:
-            params["departure_time"] = departure_time
-        if arrival_time:
-            params["arrival_time"] = arrival_time
-        if transit_mode:
-            params["transit_mode"] = transit_mode
-        if transit_routing_preference:
-            params["transit_routing_preference"] = transit_routing_preference
-        if traffic_model:
-            params["traffic_model"] = traffic_model
-        
-        data = self._make_request("/distancematrix/json", params)
-        return data
+        Args:
+            origins: List of origin strings
+            destinations: List of destination strings
+            params: Shared query parameters
+        
+        Returns:
+            Tuple of (list of (origin offset, destination offset) tuples,
+            list of request params), one entry per tile. A matrix within
+            the limits is a single tile at (0, 0).
+        """
+        if (len(origins) * len(destinations) <= cls.MATRIX_MAX_ELEMENTS
+                and max(len(origins), len(destinations)) <= cls.MATRIX_MAX_LOCATIONS):
+            size = max(len(origins), len(destinations), 1)
+        else:
+            size = cls.MATRIX_TILE_SIZE
+        
+        tiles = [
+            (row, col)
+            for row in range(0, len(origins), size)
+            for col in range(0, len(destinations), size)
+        ]
+        tile_params = [
+            dict(
+                params,
+                origins="|".join(origins[row:row + size]),
+                destinations="|".join(destinations[col:col + size]),
+            )
+            for row, col in tiles
+        ]
+        return tiles, tile_params
     
     # Time Zone API Methods
     
-    def get_timezone(self, lat, lng, timestamp=None, language=None):
+    def get_timezone(self, lat, lng, timestamp=None, language=None, no_cache=False):
         """
         Get timezone information for coordinates.
         
+        Time zones are constant over large areas, so the zone ID is remembered
+        per 0.1 degree grid cell (about 11 km) and offsets for other timestamps
+        are computed locally with zoneinfo. Only the first lookup per cell (and
+        per standard/daylight name) hits the API.
+        
         Args:
             lat: Latitude
             lng: Longitude
             timestamp: Optional Unix timestamp (defaults to current time)
             language: Optional language code
+            no_cache: If True, bypass the response cache
         
         Returns:
             Timezone information
         """
-        import time
         params = {"location": f"{lat},{lng}"}
         
         # Time Zone API requires timestamp - use current time if not provided
@@ -513,30 +1052,105 @@ class MapsAPI:
         if language:
             params["language"] = language
         
-        data = self._make_request("/timezone/json", params)
+        cell = (round(lat * 10), round(lng * 10))
+        if ZoneInfo is not None and not no_cache:
+            local = self._local_timezone(cell, timestamp, language)
+            if local:
+                return local
+        
+        data = self._make_request("/timezone/json", params, no_cache=no_cache)
+        
+        if data.get("status") == "OK":
+            if len(self._tz_cells) >= self.TZ_CELL_CACHE_SIZE:
+                self._tz_cells.clear()
+            tz_id = data.get("timeZoneId")
+            self._tz_cells[cell] = tz_id
+            self._tz_names[(tz_id, bool(data.get("dstOffset")), language)] = data.get("timeZoneName")
         return data
     
+    def _local_timezone(self, cell, timestamp, language):
+        """
+        Build a Time Zone API response from cached zone data.
+        
+        Args:
+            cell: (lat, lng) grid cell in tenths of a degree
+            timestamp: Unix timestamp
+            language: Optional language code
+        
+        Returns:
+            Timezone information, or None if the cell or name is not cached.
+        """
+        tz_id = self._tz_cells.get(cell)
+        if not tz_id:
+            return None
+        
+        try:
+            moment = datetime.fromtimestamp(timestamp, tz=timezone.utc).astimezone(ZoneInfo(tz_id))
+        except (ZoneInfoNotFoundError, ValueError, OverflowError):
+            return None
+        
+        dst_offset = int(moment.dst().total_seconds())
+        name = self._tz_names.get((tz_id, bool(dst_offset), language))
+        if not name:
+            return None
+        
+        return {
+            "status": "OK",
+            "timeZoneId": tz_id,
+            "timeZoneName": name,
+            "rawOffset": int(moment.utcoffset().total_seconds()) - dst_offset,
+            "dstOffset": dst_offset,
+        }
+    
     # Elevation API Methods
     
-    def get_elevation(self, locations, samples=None):
+    def get_elevation(self, locations, samples=None, no_cache=False, max_workers=6):
         """
         Get elevation data for locations.
         
+        Long location lists are split into chunks that are fetched
+        concurrently and cached independently.
+        
         Args:
-            locations: List of lat,lng coordinates (or pipe-separated string)
+            locations: List of "lat,lng" strings or (lat, lng) pairs
+                (or pipe-separated string)
             samples: Optional number of samples for path
+            no_cache: If True, bypass the response cache
+            max_workers: Maximum number of concurrent chunk requests
         
         Returns:
             List of elevation results
         """
-        if isinstance(locations, list):
-            locations = "|".join(locations)
+        size = self.ELEVATION_CHUNK_SIZE
+        if isinstance(locations, list) and not samples and len(locations) > size:
+            chunks = [locations[i:i + size] for i in range(0, len(locations), size)]
+            pages = self._map_concurrent(
+                lambda chunk: self.get_elevation(chunk, no_cache=no_cache),
+                chunks, max_workers
+            )
+            return [result for page in pages for result in page]
         
-        params = {"locations": locations}
+        if isinstance(locations, list):
+            locations = "|".join(map(_format_location, locations))
         
-        if samples:
-            params["samples"] = samples
+        params = {"locations": locations, **_compact((("samples", samples),))}
         
-        data = self._make_request("/elevation/json", params)
+        data = self._make_request("/elevation/json", params, no_cache=no_cache)
         return data.get("results", [])
-
+    
+    def elevation_many(self, location_batches, samples=None, max_workers=8):
+        """
+        Get elevation data for multiple location batches concurrently.
+        
+        Args:
+            location_batches: Iterable of location lists (or pipe-separated strings)
+            samples: Optional number of samples for path
+            max_workers: Maximum number of concurrent requests
+        
+        Returns:
+            List of elevation result lists, in input order
+        """
+        return self._map_concurrent(
+            lambda locations: self.get_elevation(locations, samples=samples),
+            location_batches, max_workers
+        )
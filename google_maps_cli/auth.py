@@ -1,21 +1,18 @@
 """Authentication for Google Maps Platform APIs (API Key and OAuth 2.0)."""
 
+import functools
+import importlib.util
 import os
-import json
+import time
 from pathlib import Path
 from .utils import (
     get_api_key_path, get_token_path, get_credentials_path,
-    ensure_token_permissions, set_default_account
+    set_default_account, write_private_file, json_dumps, json_loads
 )
 
-# Try to import OAuth libraries (optional)
-try:
-    from google.auth.transport.requests import Request
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    OAUTH_AVAILABLE = True
-except ImportError:
-    OAUTH_AVAILABLE = False
+# Whether the optional OAuth libraries are installed. They are slow to import,
+# so they are only loaded when OAuth is actually used; None means not yet checked.
+OAUTH_AVAILABLE = None
 
 # Google Maps Platform OAuth scopes
 # Note: These scopes may not exist for user saved places, but we'll try
@@ -27,6 +24,65 @@ SCOPES = [
 ]
 
 
+def oauth_available():
+    """
+    Check whether the optional OAuth libraries are installed, without importing them.
+    
+    Returns:
+        True if google-auth and google-auth-oauthlib can be imported.
+    """
+    global OAUTH_AVAILABLE
+    if OAUTH_AVAILABLE is None:
+        try:
+            OAUTH_AVAILABLE = all(
+                importlib.util.find_spec(name) is not None
+                for name in ("google.oauth2", "google_auth_oauthlib")
+            )
+        except ImportError:
+            OAUTH_AVAILABLE = False
+    return OAUTH_AVAILABLE
+
+
+@functools.lru_cache(maxsize=None)
+def _get_request_class():
+    """Import google-auth's HTTP transport Request class on first use."""
+    from google.auth.transport.requests import Request
+    return Request
+
+
+# Parsed key/token files, path -> ((mtime_ns, size), data), so repeated MapsAPI()
+# constructions in one process don't re-read and re-parse unchanged files
+_FILE_CACHE = {}
+
+
+def _read_json_file(path):
+    """
+    Read a small JSON file, reusing the parsed data while its mtime and size are unchanged.
+    
+    Args:
+        path: Path to the JSON file
+    
+    Returns:
+        Parsed data (shared, treat as read-only), or None if the file doesn't exist.
+    
+    Raises:
+        ValueError: If the file is not valid JSON
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    data = json_loads(path.read_bytes())
+    _FILE_CACHE[path] = (key, data)
+    return data
+
+
 def get_api_key(account=None):
     """
     Get API key from storage.
@@ -37,18 +93,13 @@ def get_api_key(account=None):
     Returns:
         API key string, or None if not found.
     """
-    api_key_path = get_api_key_path(account)
-    
-    if api_key_path.exists():
-        try:
-            with open(api_key_path) as f:
-                data = json.load(f)
-                return data.get("api_key")
-        except Exception as e:
-            print(f"Warning: Could not load API key: {e}")
-            return None
+    try:
+        data = _read_json_file(get_api_key_path(account))
+    except Exception as e:
+        print(f"Warning: Could not load API key: {e}")
+        return None
     
-    return None
+    return data.get("api_key") if data else None
 
 
 def save_api_key(api_key, account=None):
@@ -64,11 +115,7 @@ def save_api_key(api_key, account=None):
     
     api_key_path = get_api_key_path(account)
     
-    data = {"api_key": api_key}
-    with open(api_key_path, "w") as f:
-        json.dump(data, f, indent=2)
-    
-    ensure_token_permissions(api_key_path)
+    write_private_file(api_key_path, json_dumps({"api_key": api_key}, indent=True))
     
     # Set as default account if it's the first one
     set_default_account(account)
@@ -127,16 +174,23 @@ def get_oauth_credentials(account=None):
     Returns:
         Credentials object, or None if not available.
     """
-    if not OAUTH_AVAILABLE:
-        return None
-    
-    token_path = get_token_path(account)
     creds = None
     
     # Load existing token if available
-    if token_path.exists():
+    try:
+        token_info = _read_json_file(get_token_path(account))
+    except Exception as e:
+        print(f"Warning: Could not load existing OAuth token: {e}")
+        token_info = None
+    
+    if token_info:
+        try:
+            from google.oauth2.credentials import Credentials
+        except ImportError:
+            return None
+        
         try:
-            creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+            creds = Credentials.from_authorized_user_info(token_info, SCOPES)
         except Exception as e:
             print(f"Warning: Could not load existing OAuth token: {e}")
             creds = None
@@ -145,11 +199,8 @@ def get_oauth_credentials(account=None):
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
             try:
-                creds.refresh(Request())
-                # Save refreshed token
-                with open(token_path, "w") as token_file:
-                    token_file.write(creds.to_json())
-                ensure_token_permissions(token_path)
+                creds.refresh(_get_request_class()())
+                save_oauth_credentials(creds, account)
             except Exception as e:
                 print(f"Error refreshing OAuth token: {e}")
                 creds = None
@@ -157,21 +208,76 @@ def get_oauth_credentials(account=None):
     return creds
 
 
-def authenticate_oauth(account=None):
+def save_oauth_credentials(creds, account=None):
+    """
+    Save OAuth credentials to the account's token file.
+    
+    Args:
+        creds: Credentials object
+        account: Account name (optional). If None, uses default account.
+    """
+    write_private_file(get_token_path(account), creds.to_json().encode())
+
+
+def load_saved_places_endpoint(account=None):
+    """
+    Get the saved places endpoint recorded in the account's OAuth token file.
+    
+    Args:
+        account: Account name (optional). If None, uses default account.
+    
+    Returns:
+        Tuple of (endpoint or None if none worked, check timestamp),
+        or None if discovery has not run yet.
+    """
+    try:
+        data = _read_json_file(get_token_path(account))
+    except (OSError, ValueError):
+        return None
+    
+    if not data or "saved_places_checked" not in data:
+        return None
+    return data.get("saved_places_endpoint"), data["saved_places_checked"]
+
+
+def save_saved_places_endpoint(endpoint, account=None):
+    """
+    Record the result of saved places endpoint discovery in the OAuth token file.
+    
+    Args:
+        endpoint: Endpoint that returned data, or None if none did
+        account: Account name (optional). If None, uses default account.
+    """
+    token_path = get_token_path(account)
+    try:
+        data = json_loads(token_path.read_bytes())
+    except (OSError, ValueError):
+        return  # No token to annotate
+    
+    data["saved_places_endpoint"] = endpoint
+    data["saved_places_checked"] = time.time()
+    write_private_file(token_path, json_dumps(data))
+
+
+def authenticate_oauth(account=None, credentials_path=None):
     """
     Run OAuth 2.0 flow to get user credentials.
     
     Args:
         account: Account name (optional). If provided, saves token for this account.
+        credentials_path: Path to credentials.json (optional). Looked up with
+            get_credentials_path() when not given.
     
     Returns:
         Credentials object on success, None on failure.
     """
-    if not OAUTH_AVAILABLE:
+    try:
+        from google_auth_oauthlib.flow import InstalledAppFlow
+    except ImportError:
         print("❌ OAuth libraries not available. Install with: pip install google-auth google-auth-oauthlib")
         return None
     
-    credentials_path = get_credentials_path()
+    credentials_path = credentials_path or get_credentials_path()
     
     if not credentials_path:
         print("❌ Error: credentials.json not found")
@@ -198,15 +304,11 @@ def authenticate_oauth(account=None):
                 service = build("oauth2", "v2", credentials=creds)
                 user_info = service.userinfo().get().execute()
                 account = user_info.get("email", "default")
-            except:
+            except Exception:
                 account = "default"
         
         # Save credentials for next run
-        token_path = get_token_path(account)
-        with open(token_path, "w") as token_file:
-            token_file.write(creds.to_json())
-        
-        ensure_token_permissions(token_path)
+        write_private_file(get_token_path(account), creds.to_json().encode())
         
         # Set as default account if it's the first one
         set_default_account(account)
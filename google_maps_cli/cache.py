@@ -0,0 +1,210 @@
+"""On-disk response cache for Google Maps Platform requests."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from .utils import get_cache_dir, json_dumps, json_loads
+
+DAY = 24 * 60 * 60
+
+# How long responses may be reused, per endpoint (Google permits up to 30 days).
+# Endpoints not listed here are never cached.
+ENDPOINT_TTLS = {
+    "/geocode/json": 30 * DAY,
+    "/timezone/json": 30 * DAY,
+    "/elevation/json": 30 * DAY,
+    "/place/details/json": 7 * DAY,
+    "/place/textsearch/json": 1 * DAY,
+    "/place/autocomplete/json": 1 * DAY,
+    "/directions/json": 1 * DAY,
+    "/distancematrix/json": 1 * DAY,
+}
+
+# Endpoints whose results depend on live traffic when a departure time is given
+TRAFFIC_ENDPOINTS = ("/directions/json", "/distancematrix/json")
+
+# Params that tie a request to server-side state, so it must always be sent:
+# page tokens expire, and session tokens group requests for billing
+UNCACHEABLE_PARAMS = ("pagetoken", "sessiontoken")
+
+
+def get_ttl(endpoint, params):
+    """
+    Get the cache lifetime for a request.
+    
+    Args:
+        endpoint: API endpoint path
+        params: Query parameters dict
+    
+    Returns:
+        Lifetime in seconds, or 0 if the response must not be cached.
+    """
+    if endpoint in TRAFFIC_ENDPOINTS and params.get("departure_time"):
+        return 0  # Traffic-aware results change minute to minute
+    if any(name in params for name in UNCACHEABLE_PARAMS):
+        return 0
+    return ENDPOINT_TTLS.get(endpoint, 0)
+
+
+def parse_max_age(cache_control):
+    """
+    Get the lifetime allowed by a response's Cache-Control header.
+    
+    Args:
+        cache_control: Cache-Control header value, or None
+    
+    Returns:
+        max-age in seconds, 0 for no-store, or None if the header sets no limit.
+    """
+    if not cache_control:
+        return None
+    
+    max_age = None
+    for directive in cache_control.lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name == "no-store":
+            return 0
+        if name == "max-age" and value.isdigit():
+            max_age = int(value)
+    return max_age
+
+
+def make_key(endpoint, query):
+    """
+    Build a stable cache key for a request.
+    
+    The API key is excluded so that rotating keys does not invalidate the cache.
+    
+    Args:
+        endpoint: API endpoint path
+        query: Query parameters as a list of (name, value) tuples sorted by name
+    
+    Returns:
+        Hex digest string
+    """
+    payload = json.dumps(
+        [endpoint, [(k, v) for k, v in query if k != "key"]],
+        default=str
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """
+    JSON file cache of API responses with per-entry expiry.
+    
+    Recently used entries are also kept in an in-process LRU, so repeat
+    lookups within one run skip the file read and JSON parse.
+    """
+    
+    MEMORY_SIZE = 1024
+    
+    def __init__(self, directory=None):
+        """
+        Initialize response cache.
+        
+        Args:
+            directory: Cache directory (optional). Defaults to get_cache_dir().
+        """
+        self.directory = Path(directory) if directory else get_cache_dir()
+        self._memory = OrderedDict()  # Key -> entry dict, least recent first
+        self._memory_lock = threading.Lock()
+    
+    def _remember(self, key, entry):
+        """Add an entry to the in-process LRU, evicting the oldest if full."""
+        with self._memory_lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.MEMORY_SIZE:
+                self._memory.popitem(last=False)
+    
+    def _entry_path(self, key):
+        """Get the file path for a cache key."""
+        return self.directory / key[:2] / f"{key}.json"
+    
+    def get(self, key):
+        """
+        Get a cached response.
+        
+        Args:
+            key: Cache key from make_key()
+        
+        Returns:
+            Cached response data, or None if missing or expired.
+        """
+        entry = self.get_entry(key)
+        if entry is None or entry.get("expires", 0) < time.time():
+            return None
+        return entry.get("data")
+    
+    def get_entry(self, key):
+        """
+        Get a cache entry, even if expired, so it can be revalidated.
+        
+        Args:
+            key: Cache key from make_key()
+        
+        Returns:
+            Entry dict with "expires", "data" and optional "etag", or None if missing.
+        """
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        
+        if entry is None:
+            try:
+                entry = json_loads(self._entry_path(key).read_bytes())
+            except (OSError, ValueError):
+                return None
+            self._remember(key, entry)
+        
+        return entry
+    
+    def set(self, key, data, ttl, etag=None):
+        """
+        Store a response.
+        
+        Disk writes are best-effort: an unwritable cache directory or a full
+        disk leaves the entry in memory only, like a read error is a miss.
+        
+        Args:
+            key: Cache key from make_key()
+            data: JSON-serializable response data
+            ttl: Lifetime in seconds
+            etag: Optional ETag header of the response, for revalidation
+        """
+        entry = {"expires": time.time() + ttl, "data": data}
+        if etag:
+            entry["etag"] = etag
+        self._remember(key, entry)
+        
+        path = self._entry_path(key)
+        tmp_path = None
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # A unique temp file per writer, so concurrent processes storing
+            # the same key never write into each other's file
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(json_dumps(entry))
+            os.replace(tmp_path, path)
+        except OSError:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+    
+    def clear(self):
+        """Delete all cached responses."""
+        with self._memory_lock:
+            self._memory.clear()
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,33 @@
+"""Exception types for Google Maps CLI."""
+
+
+class MapsError(Exception):
+    """Base class for Google Maps CLI errors."""
+
+
+class AuthError(MapsError):
+    """Raised when no usable credentials are configured."""
+
+
+class APIError(MapsError):
+    """Raised when a Google Maps Platform request fails."""
+    
+    def __init__(self, status, message):
+        """
+        Initialize API error.
+        
+        Args:
+            status: API status code (e.g., 'REQUEST_DENIED')
+            message: Human-readable error message
+        """
+        super().__init__(f"API Error ({status}): {message}")
+        self.status = status
+        self.message = message
+
+
+class QuotaError(APIError):
+    """Raised when a daily or billing quota is exhausted."""
+
+
+class TransientError(APIError):
+    """Raised for failures that may succeed when retried."""
@@ -0,0 +1,83 @@
+"""Client-side rate limiting and retries for Google Maps Platform requests."""
+
+import functools
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket that paces calls to a steady rate."""
+    
+    def __init__(self, rate_per_sec, capacity):
+        """
+        Initialize token bucket.
+        
+        Args:
+            rate_per_sec: Tokens added per second (sustained calls per second)
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                wait = (1 - self._tokens) / self.rate
+            
+            time.sleep(wait)
+
+
+def expo_jitter(attempt, base=0.5):
+    """
+    Exponential backoff delay with jitter.
+    
+    Args:
+        attempt: Zero-based attempt number that just failed
+        base: Delay in seconds after the first failure
+    
+    Returns:
+        Delay in seconds
+    """
+    return base * 2 ** attempt + random.random() * 0.1
+
+
+def retry(on, max_attempts=3, backoff=expo_jitter, when=None):
+    """
+    Retry a function when it raises one of the given exceptions.
+    
+    Args:
+        on: Exception class (or tuple of classes) that triggers a retry
+        max_attempts: Total number of attempts before re-raising
+        backoff: Callable mapping an attempt number to a delay in seconds
+        when: Optional predicate on the caught exception; if it returns
+            False the exception is re-raised without retrying
+    
+    Returns:
+        Decorator
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except on as e:
+                    if attempt == max_attempts - 1 or (when is not None and not when(e)):
+                        raise
+                    time.sleep(backoff(attempt))
+        return wrapper
+    return decorator
@@ -1,61 +1,109 @@
 """Utility functions for Google Maps CLI."""
 
+import copy
+import functools
 import os
 import json
+import math
 from pathlib import Path
 
+# Prefer orjson's native codec when installed (pip install google-maps-cli[fast])
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Resolved once per process; the per-user config, key and token files live here
+_HOME = Path.home()
+_ACCOUNTS_CFG = _HOME / ".google_maps_accounts.json"
+_LEGACY_API_KEY_PATH = _HOME / ".google_maps_api_key.json"
+
+
+def json_loads(data):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent=False):
+    """
+    Serialize an object to UTF-8 encoded JSON.
+    
+    Args:
+        obj: JSON-serializable object
+        indent: If True, pretty-print with two-space indentation
+    
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
 
 def get_accounts_config_path():
     """Get the path to accounts configuration file."""
-    return Path.home() / ".google_maps_accounts.json"
+    return _ACCOUNTS_CFG
 
 
-def get_default_account():
-    """Get the default account name."""
+# Parsed accounts config, reused while the file's stat key is unchanged
+_config_cache = {"key": None, "data": None}
+
+
+def _load_config():
+    """
+    Read the accounts configuration file.
+    
+    The parsed data is reused until the file's (path, mtime, size) key
+    changes, so the common call costs one stat and a tuple compare.
+    
+    Returns:
+        Config dict (shared, treat as read-only); empty if the file is
+        missing or unreadable
+    """
     config_path = get_accounts_config_path()
-    if config_path.exists():
+    try:
+        st = config_path.stat()
+    except OSError:
+        return {}
+    
+    key = (config_path, st.st_mtime_ns, st.st_size)
+    if _config_cache["key"] != key:
         try:
-            with open(config_path) as f:
-                config = json.load(f)
-                return config.get("default_account")
-        except:
-            pass
-    return None
+            data = json_loads(config_path.read_bytes())
+        except (OSError, ValueError):  # ValueError covers both JSON decoders' errors
+            data = {}
+        _config_cache.update(key=key, data=data)
+    return _config_cache["data"]
+
+
+def get_default_account():
+    """Get the default account name."""
+    return _load_config().get("default_account")
 
 
 def set_default_account(account_name):
     """Set the default account name."""
     config_path = get_accounts_config_path()
-    config = {}
-    if config_path.exists():
-        try:
-            with open(config_path) as f:
-                config = json.load(f)
-        except:
-            pass
+    current = _load_config()
+    if (current.get("default_account") == account_name
+            and account_name in current.get("accounts", ())):
+        return  # Already the default; nothing to write
     
+    config = copy.deepcopy(current)
     config["default_account"] = account_name
-    if "accounts" not in config:
-        config["accounts"] = []
-    if account_name not in config["accounts"]:
-        config["accounts"].append(account_name)
+    accounts = config.setdefault("accounts", [])
+    if account_name not in accounts:
+        accounts.append(account_name)
     
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
-    ensure_token_permissions(config_path)
+    write_private_file(config_path, json_dumps(config))
+    _config_cache["key"] = None
 
 
 def list_accounts():
     """List all configured accounts."""
-    config_path = get_accounts_config_path()
-    if config_path.exists():
-        try:
-            with open(config_path) as f:
-                config = json.load(f)
-                return config.get("accounts", [])
-        except:
-            pass
-    return []
+    return _load_config().get("accounts", [])
 
 
 def get_api_key_path(account=None):
@@ -63,26 +111,34 @@ def get_api_key_path(account=None):
     if account is None:
         account = get_default_account()
     
-    if account:
-        return Path.home() / f".google_maps_api_key_{account}.json"
-    else:
-        # Legacy: default API key file
-        return Path.home() / ".google_maps_api_key.json"
+    return _api_key_path_for(account)
+
+
+@functools.lru_cache(maxsize=16)
+def _api_key_path_for(account):
+    """Build (once per account) the API key file path; falsy means the legacy file."""
+    return _HOME / f".google_maps_api_key_{account}.json" if account else _LEGACY_API_KEY_PATH
+
+
+_credentials_path = None
 
 
 def get_credentials_path():
-    """Get the path to credentials.json file (for OAuth if needed)."""
-    # Check current directory first
-    current_dir = Path.cwd() / "credentials.json"
-    if current_dir.exists():
-        return current_dir
-    
-    # Check home directory
-    home_dir = Path.home() / "credentials.json"
-    if home_dir.exists():
-        return home_dir
+    """
+    Get the path to credentials.json file (for OAuth if needed).
     
-    return None
+    The current directory is checked before the home directory. Once the
+    file is found its path is reused; a miss is never cached, so a file
+    dropped in place while the process runs is still picked up.
+    """
+    global _credentials_path
+    if _credentials_path is None:
+        for base in (Path.cwd(), _HOME):
+            path = base / "credentials.json"
+            if path.exists():
+                _credentials_path = path
+                break
+    return _credentials_path
 
 
 def get_token_path(account=None):
@@ -91,15 +147,44 @@ def get_token_path(account=None):
         account = get_default_account()
     
     if account:
-        return Path.home() / f".google_maps_token_{account}.json"
+        return _HOME / f".google_maps_token_{account}.json"
     else:
-        return Path.home() / ".google_maps_token.json"
+        return _HOME / ".google_maps_token.json"
+
+
+def get_cache_dir():
+    """Get the directory used for cached API responses."""
+    return _HOME / ".google_maps_cache"
 
 
 def ensure_token_permissions(token_path):
     """Ensure token file has secure permissions (600)."""
-    if token_path.exists():
+    try:
         os.chmod(token_path, 0o600)
+    except FileNotFoundError:
+        pass
+
+
+def write_private_file(path, data):
+    """
+    Atomically replace a file with data, readable only by the owner.
+    
+    The data goes to a sibling temp file that is created with mode 600 (and
+    re-restricted in case a stale temp file was left behind), then renamed
+    over path, so readers never see a partially written file and the
+    contents are never written to a file others can read.
+    
+    Args:
+        path: Destination path
+        data: File contents (bytes)
+    """
+    tmp_path = path.with_suffix(".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    if hasattr(os, "fchmod"):  # Not available on Windows
+        os.fchmod(fd, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
 
 
 def format_coordinates(lat, lng):
@@ -109,39 +194,47 @@ def format_coordinates(lat, lng):
 
 def parse_coordinates(coord_str):
     """Parse coordinate string (lat,lng) into tuple."""
+    lat, sep, lng = coord_str.partition(",")
+    if not sep or "," in lng:
+        raise ValueError(f"Invalid coordinate format: {coord_str}")
     try:
-        parts = coord_str.split(",")
-        if len(parts) != 2:
-            raise ValueError("Invalid coordinate format")
-        return float(parts[0].strip()), float(parts[1].strip())
-    except Exception as e:
+        # float() ignores surrounding whitespace itself
+        lat, lng = float(lat), float(lng)
+    except ValueError as e:
         raise ValueError(f"Invalid coordinate format: {coord_str}") from e
+    if not (math.isfinite(lat) and math.isfinite(lng)):
+        raise ValueError(f"Invalid coordinate format: {coord_str}")
+    return lat, lng
 
 
+# Upper bound (exclusive), format and divisor for each format_distance range;
+# anything not below a bound (including NaN) uses the last format
+_DISTANCE_FORMATS = (
+    (1000, "{:.0f}m", 1),
+    (10000, "{:.2f}km", 1000),
+)
+_DISTANCE_FORMAT_LAST = ("{:.1f}km", 1000)
+
+
+# Memoized: matrix and route output repeat the same values
+@functools.lru_cache(maxsize=1024)
 def format_distance(meters):
     """Format distance in meters to human-readable format."""
-    if meters < 1000:
-        return f"{meters:.0f}m"
-    elif meters < 10000:
-        return f"{meters/1000:.2f}km"
-    else:
-        return f"{meters/1000:.1f}km"
+    for limit, fmt, divisor in _DISTANCE_FORMATS:
+        if meters < limit:
+            return fmt.format(meters / divisor)
+    fmt, divisor = _DISTANCE_FORMAT_LAST
+    return fmt.format(meters / divisor)
 
 
+# typed=True keeps 5 and 5.0 apart, since "5s" and "5.0s" differ
+@functools.lru_cache(maxsize=1024, typed=True)
 def format_duration(seconds):
     """Format duration in seconds to human-readable format."""
     if seconds < 60:
         return f"{seconds}s"
-    elif seconds < 3600:
-        minutes = int(seconds / 60)
-        secs = int(seconds % 60)
-        if secs > 0:
-            return f"{minutes}m {secs}s"
-        return f"{minutes}m"
-    else:
-        hours = int(seconds / 3600)
-        minutes = int((seconds % 3600) / 60)
-        if minutes > 0:
-            return f"{hours}h {minutes}m"
-        return f"{hours}h"
-
+    minutes, secs = divmod(int(seconds), 60)
+    if minutes < 60:
+        return f"{minutes}m {secs}s" if secs else f"{minutes}m"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes}m" if minutes else f"{hours}h"
@@ -33,6 +33,9 @@ setup(
         "google-auth-oauthlib>=1.0.0",
         "google-api-python-client>=2.0.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "maps=google_maps_cli.cli:cli",
@@ -1,8 +1,20 @@
 """Basic tests for Google Maps CLI API."""
 
+import asyncio
+import json
+import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
+import requests
+from google_maps_cli.aapi import AsyncMapsAPI
 from google_maps_cli.api import MapsAPI
+from google_maps_cli.cache import ResponseCache, make_key
+from google_maps_cli.errors import APIError, MapsError, TransientError
 
 
 class TestMapsAPI(unittest.TestCase):
@@ -23,12 +35,12 @@ class TestMapsAPI(unittest.TestCase):
             MapsAPI()
     
     @patch('google_maps_cli.api.check_auth')
-    @patch('google_maps_cli.api.requests.get')
+    @patch('google_maps_cli.api.requests.Session.get')
     def test_make_request_success(self, mock_get, mock_check_auth):
         """Test successful API request."""
         mock_check_auth.return_value = "test_api_key"
         mock_response = MagicMock()
-        mock_response.json.return_value = {"status": "OK", "results": []}
+        mock_response.content = json.dumps({"status": "OK", "results": []}).encode()
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
         
@@ -39,24 +51,471 @@ class TestMapsAPI(unittest.TestCase):
         mock_get.assert_called_once()
     
     @patch('google_maps_cli.api.check_auth')
-    @patch('google_maps_cli.api.requests.get')
+    @patch('google_maps_cli.api.requests.Session.get')
     def test_make_request_error(self, mock_get, mock_check_auth):
         """Test API request with error status."""
         mock_check_auth.return_value = "test_api_key"
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "status": "REQUEST_DENIED",
             "error_message": "Invalid API key"
-        }
+        }).encode()
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
         
         api = MapsAPI()
-        with self.assertRaises(Exception) as context:
+        with self.assertRaises(APIError) as context:
             api._make_request("/test", {})
         
         self.assertIn("REQUEST_DENIED", str(context.exception))
+        self.assertEqual(context.exception.status, "REQUEST_DENIED")
+    
+    @patch('google_maps_cli.ratelimit.time.sleep')
+    @patch('google_maps_cli.api.check_auth')
+    @patch('google_maps_cli.api.requests.Session.get')
+    def test_send_retries_only_api_level_statuses(self, mock_get, mock_check_auth, mock_sleep):
+        """Test that transport failures are not retried on top of the adapter's retries."""
+        mock_check_auth.return_value = "test_api_key"
+        mock_get.side_effect = requests.exceptions.ConnectionError("refused")
+        api = MapsAPI()
+        
+        with self.assertRaises(TransientError):
+            api._make_request("/test", {}, no_cache=True)
+        self.assertEqual(mock_get.call_count, 1)
+        
+        mock_get.reset_mock()
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"status": "UNKNOWN_ERROR"}).encode()
+        mock_get.side_effect = None
+        mock_get.return_value = mock_response
+        with self.assertRaises(TransientError):
+            api._make_request("/test", {}, no_cache=True)
+        self.assertEqual(mock_get.call_count, 3)
+    
+    @patch('urllib3.util.retry.time.sleep')
+    @patch('google_maps_cli.api.check_auth')
+    def test_http_status_after_adapter_retries_is_transient(self, mock_check_auth, mock_sleep):
+        """Test that a 5xx outlasting the adapter's retries surfaces as TransientError."""
+        mock_check_auth.return_value = "test_api_key"
+        hits = []
+        
+        class Unavailable(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            
+            def log_message(self, *args):
+                pass
+        
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Unavailable)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            api = MapsAPI()
+            api._session = MapsAPI._create_session()
+            api._session.mount("http://", api._session.get_adapter("https://"))
+            api.BASE_URL = f"http://127.0.0.1:{server.server_port}"
+            
+            with self.assertRaises(TransientError) as context:
+                api._make_request("/test", {}, no_cache=True)
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        self.assertEqual(context.exception.status, "HTTP_503")
+        self.assertGreater(len(hits), 1)
+    
+    @patch('google_maps_cli.api.check_auth')
+    def test_session_reused_across_requests(self, mock_check_auth):
+        """Test that requests share one pooled session."""
+        mock_check_auth.return_value = "test_api_key"
+        api = MapsAPI()
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"status": "OK", "results": []}).encode()
+        
+        with patch.object(api._session, "get", return_value=mock_response) as mock_get:
+            api._make_request("/test", {})
+            api._make_request("/test", {})
+        
+        self.assertEqual(mock_get.call_count, 2)
+    
+    @patch('google_maps_cli.api.check_auth')
+    def test_session_shared_across_clients(self, mock_check_auth):
+        """Test that clients share one process-wide session."""
+        mock_check_auth.return_value = "test_api_key"
+        self.assertIs(MapsAPI()._session, MapsAPI("other")._session)
+    
+    @patch('google_maps_cli.api.check_auth')
+    def test_get_place_photo_builds_url(self, mock_check_auth):
+        """Test photo URLs are built without an API request."""
+        mock_check_auth.return_value = "test_api_key"
+        api = MapsAPI()
+        
+        url = api.get_place_photo("abc 123", max_height=300)
+        
+        self.assertEqual(
+            url,
+            f"{MapsAPI.BASE_URL}/place/photo?key=test_api_key"
+            "&photo_reference=abc+123&maxheight=300"
+        )
+    
+    @patch('google_maps_cli.api.check_auth')
+    def test_context_manager_closes_session(self, mock_check_auth):
+        """Test the session is closed when leaving a with block."""
+        mock_check_auth.return_value = "test_api_key"
+        with patch('google_maps_cli.api.requests.Session.close') as mock_close:
+            with MapsAPI() as api:
+                self.assertIsInstance(api, MapsAPI)
+            mock_close.assert_called_once()
+    
+    @patch('google_maps_cli.api.save_saved_places_endpoint')
+    @patch('google_maps_cli.api.load_saved_places_endpoint')
+    @patch('google_maps_cli.api.check_auth')
+    def test_get_saved_places_uses_known_endpoint(self, mock_check_auth, mock_load, mock_save):
+        """Test that a previously discovered endpoint is tried first."""
+        mock_check_auth.return_value = MagicMock(expiry=None)
+        mock_load.return_value = ("/maps/v1/lists", time.time())
+        api = MapsAPI(use_oauth=True)
+        
+        with patch.object(api, "_make_request", return_value={"lists": []}) as mock_request:
+            self.assertEqual(api.get_saved_places(), {"lists": []})
+        
+        mock_request.assert_called_once_with("/maps/v1/lists", use_user_data_api=True)
+        mock_save.assert_not_called()
+    
+    @patch('google_maps_cli.api.save_saved_places_endpoint')
+    @patch('google_maps_cli.api.load_saved_places_endpoint')
+    @patch('google_maps_cli.api.check_auth')
+    def test_get_saved_places_keeps_endpoint_on_transient_error(self, mock_check_auth, mock_load, mock_save):
+        """Test that a transient failure is raised without forgetting the known endpoint."""
+        mock_check_auth.return_value = MagicMock(expiry=None)
+        mock_load.return_value = ("/maps/v1/lists", time.time())
+        api = MapsAPI(use_oauth=True)
+        
+        with patch.object(api, "_make_request", side_effect=TransientError("HTTP_503", "down")):
+            with self.assertRaises(TransientError):
+                api.get_saved_places()
+        
+        mock_save.assert_not_called()
+    
+    @patch('google_maps_cli.api.save_saved_places_endpoint')
+    @patch('google_maps_cli.api.load_saved_places_endpoint')
+    @patch('google_maps_cli.api.check_auth')
+    def test_get_saved_places_records_missing_endpoints(self, mock_check_auth, mock_load, mock_save):
+        """Test that the negative result is stored only when every endpoint is missing."""
+        mock_check_auth.return_value = MagicMock(expiry=None)
+        mock_load.return_value = None
+        api = MapsAPI(use_oauth=True)
+        
+        with patch.object(api, "_make_request", side_effect=APIError("HTTP_404", "not found")) as mock_request:
+            with self.assertRaises(MapsError):
+                api.get_saved_places()
+        
+        self.assertEqual(mock_request.call_count, len(MapsAPI.SAVED_PLACES_ENDPOINTS))
+        mock_save.assert_called_once_with(None, api.account)
+    
+    @patch('google_maps_cli.api.save_oauth_credentials')
+    @patch('google_maps_cli.api._get_request_class')
+    @patch('google_maps_cli.api.check_auth')
+    def test_oauth_token_refreshed_once_before_expiry(self, mock_check_auth, mock_request_class, mock_save):
+        """Test that a token close to expiry is refreshed once, up front."""
+        creds = MagicMock(token="old", refresh_token="refresh")
+        creds.expiry = datetime.utcnow() + timedelta(seconds=30)
+        
+        def refresh(request):
+            creds.token = "new"
+            creds.expiry = datetime.utcnow() + timedelta(hours=1)
+        
+        creds.refresh.side_effect = refresh
+        mock_check_auth.return_value = creds
+        
+        api = MapsAPI(use_oauth=True)
+        api._maybe_refresh()
+        
+        creds.refresh.assert_called_once()
+        mock_save.assert_called_once_with(creds, None)
+    
+    @patch('google_maps_cli.api.check_auth')
+    def test_geocode_many_preserves_order(self, mock_check_auth):
+        """Test that batch geocoding returns results in input order."""
+        mock_check_auth.return_value = "test_api_key"
+        api = MapsAPI()
+        
+        with patch.object(api, "geocode", side_effect=lambda address, **kwargs: [address]):
+            results = api.geocode_many(["a", "b", "c"])
+        
+        self.assertEqual(results, [["a"], ["b"], ["c"]])
+    
+    @patch('google_maps_cli.api.check_auth')
+    @patch('google_maps_cli.api.requests.Session.get')
+    def test_make_request_uses_cache(self, mock_get, mock_check_auth):
+        """Test that cacheable responses are served from the cache."""
+        mock_check_auth.return_value = "test_api_key"
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"status": "OK", "results": [{"place_id": "x"}]}).encode()
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+        
+        api = MapsAPI()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            api._cache = ResponseCache(cache_dir)
+            first = api._make_request("/geocode/json", {"address": "Main St"})
+            second = api._make_request("/geocode/json", {"address": "Main St"})
+        
+        self.assertEqual(first, second)
+        mock_get.assert_called_once()
+    
+    @patch('google_maps_cli.api.check_auth')
+    @patch('google_maps_cli.api.requests.Session.get')
+    def test_make_request_survives_unwritable_cache(self, mock_get, mock_check_auth):
+        """Test that a failed cache write does not fail the request."""
+        mock_check_auth.return_value = "test_api_key"
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"status": "OK", "results": []}).encode()
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+        
+        api = MapsAPI()
+        with tempfile.NamedTemporaryFile() as not_a_dir:
+            api._cache = ResponseCache(f"{not_a_dir.name}/cache")
+            result = api._make_request("/geocode/json", {"address": "Main St"})
+        
+        self.assertEqual(result["status"], "OK")
+    
+    @patch('google_maps_cli.api.check_auth')
+    @patch('google_maps_cli.api.requests.Session.get')
+    def test_make_request_revalidates_stale_entry(self, mock_get, mock_check_auth):
+        """Test that an expired entry with an ETag is revalidated, not refetched."""
+        mock_check_auth.return_value = "test_api_key"
+        not_modified = MagicMock(status_code=304, headers={})
+        mock_get.return_value = not_modified
+        
+        api = MapsAPI()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            api._cache = ResponseCache(cache_dir)
+            key = make_key("/geocode/json", [("address", "Main St")])
+            api._cache.set(key, {"status": "OK", "results": ["cached"]}, -1, etag='"v1"')
+            result = api._make_request("/geocode/json", {"address": "Main St"})
+            fresh = api._cache.get(key)
+        
+        self.assertEqual(result["results"], ["cached"])
+        self.assertEqual(fresh, result)
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+    
+    @patch('google_maps_cli.api.check_auth')
+    @patch('google_maps_cli.api.requests.Session.get')
+    def test_make_request_respects_no_store(self, mock_get, mock_check_auth):
+        """Test that responses marked no-store are not cached."""
+        mock_check_auth.return_value = "test_api_key"
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"status": "OK", "results": []}).encode()
+        mock_response.headers = {"Cache-Control": "no-store"}
+        mock_get.return_value = mock_response
+        
+        api = MapsAPI()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            api._cache = ResponseCache(cache_dir)
+            api._make_request("/geocode/json", {"address": "Main St"})
+            api._make_request("/geocode/json", {"address": "Main St"})
+        
+        self.assertEqual(mock_get.call_count, 2)
+    
+    @patch('google_maps_cli.ratelimit.time.sleep')
+    @patch('google_maps_cli.api.check_auth')
+    @patch('google_maps_cli.api.requests.Session.get')
+    def test_make_request_retries_over_query_limit(self, mock_get, mock_check_auth, mock_sleep):
+        """Test that OVER_QUERY_LIMIT is retried before succeeding."""
+        mock_check_auth.return_value = "test_api_key"
+        limited = MagicMock()
+        limited.content = json.dumps({"status": "OVER_QUERY_LIMIT"}).encode()
+        ok = MagicMock()
+        ok.content = json.dumps({"status": "OK", "results": []}).encode()
+        mock_get.side_effect = [limited, ok]
+        
+        api = MapsAPI()
+        result = api._make_request("/test", {})
+        
+        self.assertEqual(result["status"], "OK")
+        self.assertEqual(mock_get.call_count, 2)
+    
+    @patch('google_maps_cli.api.check_auth')
+    def test_distance_matrix_tiles_large_requests(self, mock_check_auth):
+        """Test that large matrices are split into tiles and stitched back."""
+        mock_check_auth.return_value = "test_api_key"
+        
+        def fake_request(endpoint, params, no_cache=False):
+            origins = params["origins"].split("|")
+            destinations = params["destinations"].split("|")
+            return {
+                "status": "OK",
+                "origin_addresses": origins,
+                "destination_addresses": destinations,
+                "rows": [{"elements": [{"pair": f"{o}>{d}"} for d in destinations]}
+                         for o in origins],
+            }
+        
+        api = MapsAPI()
+        origins = [f"o{i}" for i in range(23)]
+        destinations = [f"d{j}" for j in range(12)]
+        with patch.object(api, "_make_request", side_effect=fake_request) as mock_request:
+            result = api.get_distance_matrix(origins, destinations)
+        
+        self.assertEqual(mock_request.call_count, 6)
+        self.assertEqual(result["origin_addresses"], origins)
+        self.assertEqual(result["destination_addresses"], destinations)
+        self.assertEqual(result["rows"][22]["elements"][11]["pair"], "o22>d11")
+    
+    @patch('google_maps_cli.api.check_auth')
+    def test_distance_matrix_short_tile_leaves_not_found(self, mock_check_auth):
+        """Test that cells missing from a short tile read as NOT_FOUND, not None."""
+        mock_check_auth.return_value = "test_api_key"
+        api = MapsAPI()
+        origins = [f"o{i}" for i in range(23)]
+        with patch.object(api, "_make_request", return_value={"status": "OK", "rows": []}):
+            result = api.get_distance_matrix(origins, [f"d{j}" for j in range(12)])
+        
+        self.assertEqual(len(result["rows"]), 23)
+        self.assertEqual(result["rows"][22]["elements"][11], {"status": "NOT_FOUND"})
+    
+    @patch('google_maps_cli.api.check_auth')
+    def test_get_elevation_accepts_coordinate_pairs(self, mock_check_auth):
+        """Test that (lat, lng) tuples are serialized into the locations param."""
+        mock_check_auth.return_value = "test_api_key"
+        api = MapsAPI()
+        
+        with patch.object(api, "_make_request", return_value={"results": []}) as mock_request:
+            api.get_elevation([(40.7128, -74.006), "39.7391536,-104.9847034"])
+        
+        params = mock_request.call_args[0][1]
+        self.assertEqual(params["locations"], "40.7128,-74.006|39.7391536,-104.9847034")
+    
+    @patch('google_maps_cli.api.check_auth')
+    def test_get_timezone_reuses_grid_cell(self, mock_check_auth):
+        """Test that nearby timezone lookups are answered locally."""
+        mock_check_auth.return_value = "test_api_key"
+        api = MapsAPI()
+        response = {
+            "status": "OK",
+            "timeZoneId": "America/New_York",
+            "timeZoneName": "Eastern Standard Time",
+            "rawOffset": -18000,
+            "dstOffset": 0,
+        }
+        
+        with patch.object(api, "_make_request", return_value=response) as mock_request:
+            api.get_timezone(40.7128, -74.0060, timestamp=1704067200)
+            result = api.get_timezone(40.7306, -73.9866, timestamp=1706745600)
+        
+        mock_request.assert_called_once()
+        self.assertEqual(result["timeZoneId"], "America/New_York")
+        self.assertEqual(result["rawOffset"], -18000)
+        self.assertEqual(result["dstOffset"], 0)
+    
+    @patch('google_maps_cli.api.check_auth')
+    def test_make_request_coalesces_concurrent_duplicates(self, mock_check_auth):
+        """Test that identical in-flight requests share one HTTP call."""
+        mock_check_auth.return_value = "test_api_key"
+        api = MapsAPI()
+        release = threading.Event()
+        calls = []
+        
+        def slow_send(endpoint, params, use_user_data_api=False, stale=None):
+            calls.append(endpoint)
+            release.wait(1)
+            return {"status": "OK"}, None, None
+        
+        with patch.object(api, "_send", side_effect=slow_send):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(api._make_request, "/test", {"q": "x"})
+                           for _ in range(2)]
+                time.sleep(0.05)
+                release.set()
+                results = [f.result() for f in futures]
+        
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results[0], results[1])
+
 
+class TestAsyncMapsAPI(unittest.TestCase):
+    """Test cases for AsyncMapsAPI class."""
+    
+    @patch('google_maps_cli.api.check_auth')
+    def test_reverse_geocode_many_preserves_order(self, mock_check_auth):
+        """Test concurrent reverse geocoding returns results in input order."""
+        mock_check_auth.return_value = "test_api_key"
+        
+        async def run():
+            async with AsyncMapsAPI() as api:
+                with patch.object(api._api, 'reverse_geocode',
+                                  side_effect=lambda lat, lng: [f"{lat},{lng}"]):
+                    return await api.reverse_geocode_many([(1, 2), (3, 4), (5, 6)])
+        
+        self.assertEqual(asyncio.run(run()), [["1,2"], ["3,4"], ["5,6"]])
+    
+    @patch('google_maps_cli.api.check_auth')
+    def test_search_and_enrich_skips_results_without_place_id(self, mock_check_auth):
+        """Test that a result with no place ID is skipped instead of failing the batch."""
+        mock_check_auth.return_value = "test_api_key"
+        
+        async def pages(endpoint, params, max_results):
+            yield [{"place_id": "a"}, {"name": "no id"}, {"place_id": "b"}]
+        
+        async def details(place_id, **kwargs):
+            return {"place_id": place_id}
+        
+        async def run():
+            async with AsyncMapsAPI() as api:
+                with patch.object(api, '_paginate', side_effect=pages), \
+                        patch.object(api, 'get_place_details', side_effect=details):
+                    return await api.search_and_enrich("cafe")
+        
+        self.assertEqual(asyncio.run(run()), [{"place_id": "a"}, {"place_id": "b"}])
+    
+    @patch('google_maps_cli.api.check_auth')
+    def test_concurrent_duplicate_calls_coalesced(self, mock_check_auth):
+        """Test that identical concurrent calls share one underlying request."""
+        mock_check_auth.return_value = "test_api_key"
+        
+        async def run():
+            api = AsyncMapsAPI()
+            with patch.object(api._api, 'geocode', return_value=["result"]) as mock_geocode:
+                results = await asyncio.gather(api.geocode("Main St"), api.geocode("Main St"))
+            return results, mock_geocode.call_count
+        
+        results, call_count = asyncio.run(run())
+        self.assertEqual(results, [["result"], ["result"]])
+        self.assertEqual(call_count, 1)
+    
+    @patch('google_maps_cli.api.check_auth')
+    def test_distance_matrix_tiles_large_requests(self, mock_check_auth):
+        """Test that large matrices are fetched as concurrent tiles and stitched back."""
+        mock_check_auth.return_value = "test_api_key"
+        
+        def fake_request(endpoint, params, no_cache=False):
+            origins = params["origins"].split("|")
+            destinations = params["destinations"].split("|")
+            return {
+                "status": "OK",
+                "origin_addresses": origins,
+                "destination_addresses": destinations,
+                "rows": [{"elements": [{"pair": f"{o}>{d}"} for d in destinations]}
+                         for o in origins],
+            }
+        
+        origins = [f"o{i}" for i in range(23)]
+        destinations = [f"d{j}" for j in range(12)]
+        
+        async def run():
+            api = AsyncMapsAPI()
+            with patch.object(api._api, "_make_request", side_effect=fake_request) as mock_request:
+                result = await api.get_distance_matrix(origins, destinations)
+            return result, mock_request.call_count
+        
+        result, call_count = asyncio.run(run())
+        self.assertEqual(call_count, 6)
+        self.assertEqual(result["origin_addresses"], origins)
+        self.assertEqual(result["rows"][22]["elements"][11]["pair"], "o22>d11")
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,67 @@
+"""Basic tests for Google Maps CLI commands."""
+
+import json
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from click.testing import CliRunner
+from google_maps_cli.cli import cli
+from google_maps_cli.errors import APIError
+
+
+class TestCLI(unittest.TestCase):
+    """Test cases for the command-line interface."""
+    
+    def setUp(self):
+        self.runner = CliRunner()
+    
+    @patch('google_maps_cli._cmd_geocode.get_api')
+    def test_lazy_command_is_loaded_and_runs(self, mock_get_api):
+        """Test that a command listed only in the lazy map is imported and invoked."""
+        self.assertNotIn("geocode", cli.commands)
+        mock_get_api.return_value.geocode.return_value = [{
+            "formatted_address": "1 Main St",
+            "geometry": {"location": {"lat": 1.5, "lng": 2.5}},
+        }]
+        
+        result = self.runner.invoke(cli, ["geocode", "Main St"])
+        
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("1. 1 Main St", result.output)
+        self.assertIn("geocode-batch", self.runner.invoke(cli, ["--help"]).output)
+    
+    @patch('google_maps_cli._cmd_geocode.get_api')
+    def test_command_error_exits_with_status_1(self, mock_get_api):
+        """Test that an error inside a command is reported and exits with status 1."""
+        mock_get_api.return_value.geocode.side_effect = APIError("REQUEST_DENIED", "Invalid API key")
+        
+        result = self.runner.invoke(cli, ["geocode", "Main St"])
+        
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("❌ Error: API Error (REQUEST_DENIED): Invalid API key", result.output)
+    
+    @patch('google_maps_cli._cmd_geocode.get_api')
+    def test_geocode_batch_keeps_order_and_reports_errors(self, mock_get_api):
+        """Test that geocode-batch writes one line per address, in input order."""
+        def geocode(address, **kwargs):
+            if address == "slow":
+                time.sleep(0.05)  # Finish after the later addresses
+            elif address == "bad":
+                raise APIError("INVALID_REQUEST", "bad address")
+            return [{"formatted_address": address.upper()}]
+        
+        mock_get_api.return_value = MagicMock(geocode=MagicMock(side_effect=geocode))
+        
+        result = self.runner.invoke(cli, ["geocode-batch", "--parallel", "3"],
+                                    input="slow\n\n  \nbad\nfast\n")
+        
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual([json.loads(line) for line in result.output.splitlines()], [
+            {"address": "slow", "results": [{"formatted_address": "SLOW"}]},
+            {"address": "bad", "error": "API Error (INVALID_REQUEST): bad address"},
+            {"address": "fast", "results": [{"formatted_address": "FAST"}]},
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()